@@ -5,6 +5,7 @@ This example mimics a real prescription pad scenario with all fields.
 """
 
 import json
+from collections import Counter
 from datetime import datetime, timedelta
 
 from scribe2fhir.core import (
@@ -262,18 +263,16 @@ def main():
     print("=" * 80)
     print(json.dumps(fhir_bundle, indent=2))
     
-    # Summary
-    bundle_obj = builder.get_bundle()
+    # Summary (counted from the bundle dict above rather than rebuilding
+    # the Bundle with get_bundle())
+    entries = fhir_bundle.get("entry") or []
     print(f"\n{'=' * 80}")
     print("BUNDLE SUMMARY")
     print("=" * 80)
-    print(f"Total entries: {len(bundle_obj.entry or [])}")
+    print(f"Total entries: {len(entries)}")
     print("\nResources by type:")
     
-    resource_counts = {}
-    for entry in bundle_obj.entry or []:
-        resource_type = entry.resource.get_resource_type()
-        resource_counts[resource_type] = resource_counts.get(resource_type, 0) + 1
+    resource_counts = Counter(entry["resource"]["resourceType"] for entry in entries)
     
     for resource_type, count in sorted(resource_counts.items()):
         print(f"  - {resource_type}: {count}")
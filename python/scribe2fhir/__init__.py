@@ -10,5 +10,20 @@ __version__ = "0.1.0"
 __author__ = "Scribe2FHIR Team"
 __email__ = "contact@scribe2fhir.org"
 
-# Import core functionality for easy access
-from .core import *
+# Core functionality is re-exported lazily: scribe2fhir.core resolves its
+# names on first access, and a star import here would resolve all of them
+from . import core
+
+__all__ = list(core.__all__)
+
+
+def __getattr__(name):
+    if name not in core.__all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(core, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
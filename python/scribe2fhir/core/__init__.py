@@ -34,79 +34,178 @@ Quick Start:
     fhir_json = builder.convert_to_fhir()
 """
 
-# Main builder class
-from .document_builder import FHIRDocumentBuilder
-
-# Resource builders (for advanced usage)
-from .resources.symptom import SymptomBuilder
-from .resources.condition import ConditionBuilder
-from .resources.medication import MedicationBuilder, DosageBuilder
-from .resources.patient import PatientBuilder, IdentifierType, Gender
-from .resources.encounter import EncounterBuilder, EncounterClass, EncounterStatus
-from .resources.observation import ObservationBuilder, ObservationCategory, VitalSignCodes
-from .resources.service_request import (
-    ServiceRequestBuilder,
-    ServiceRequestCategory,
-    ServiceRequestStatus,
-    ServiceRequestPriority,
-)
-from .resources.procedure import ProcedureBuilder, ProcedureStatus
-from .resources.family_history import (
-    FamilyMemberHistoryBuilder,
-    FamilyRelationship,
-    FamilyMemberHistoryStatus,
-)
-from .resources.allergy import (
-    AllergyBuilder,
-    AllergyCategory,
-    AllergyType,
-    AllergyClinicalStatus,
-    AllergyCriticality,
-    ReactionSeverity,
-)
-from .resources.immunization import ImmunizationBuilder, ImmunizationStatus
-from .resources.appointment import AppointmentBuilder, AppointmentStatus, ParticipantStatus
-from .resources.care_plan import AdviceBuilder, ClinicalNoteBuilder, CarePlanStatus, CommunicationStatus
-
-# Enums for validated values
-from .enums import (
-    # Observation-related
-    ObservationStatus,
-    FindingStatus,
-    Interpretation,
+# Builders, enums and type helpers are imported on first access (PEP 562),
+# so importing the package does not load every fhir.resources model up front
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Main builder class
+    from .document_builder import FHIRDocumentBuilder
+
+    # Resource builders (for advanced usage)
+    from .resources.symptom import SymptomBuilder
+    from .resources.condition import ConditionBuilder
+    from .resources.medication import MedicationBuilder, DosageBuilder
+    from .resources.patient import PatientBuilder, IdentifierType, Gender
+    from .resources.encounter import EncounterBuilder, EncounterClass, EncounterStatus
+    from .resources.observation import ObservationBuilder, ObservationCategory, VitalSignCodes
+    from .resources.service_request import (
+        ServiceRequestBuilder,
+        ServiceRequestCategory,
+        ServiceRequestStatus,
+        ServiceRequestPriority,
+    )
+    from .resources.procedure import ProcedureBuilder, ProcedureStatus
+    from .resources.family_history import (
+        FamilyMemberHistoryBuilder,
+        FamilyRelationship,
+        FamilyMemberHistoryStatus,
+    )
+    from .resources.allergy import (
+        AllergyBuilder,
+        AllergyCategory,
+        AllergyType,
+        AllergyClinicalStatus,
+        AllergyCriticality,
+        ReactionSeverity,
+    )
+    from .resources.immunization import ImmunizationBuilder, ImmunizationStatus
+    from .resources.appointment import AppointmentBuilder, AppointmentStatus, ParticipantStatus
+    from .resources.care_plan import AdviceBuilder, ClinicalNoteBuilder, CarePlanStatus, CommunicationStatus
+
+    # Enums for validated values
+    from .enums import (
+        # Observation-related
+        ObservationStatus,
+        FindingStatus,
+        Interpretation,
+
+        # Condition-related
+        ConditionClinicalStatus,
+        ConditionVerificationStatus,
+        ConditionCategory,
+
+        # Common clinical
+        Severity,
+        Laterality,
+
+        # Medication-related
+        MedicationRequestStatus,
+        MedicationRequestIntent,
+        MedicationStatementStatus,
+        RouteOfAdministration,
+        EventTiming,
+    )
+
+    # Type helpers
+    from .types import (
+        CodeInput,
+        DateTimeInput,
+        QuantityInput,
+        CodingSystem,
+        create_codeable_concept,
+        create_coding,
+        create_quantity,
+        create_period,
+        create_annotation,
+        create_reference,
+        parse_code_input,
+        parse_code_input_fresh,
+        parse_code_input_dict,
+        parse_quantity_input,
+    )
+
+
+_LAZY_IMPORTS = {
+    # Main builder
+    "FHIRDocumentBuilder": ".document_builder",
     
-    # Condition-related
-    ConditionClinicalStatus,
-    ConditionVerificationStatus,
-    ConditionCategory,
+    # Resource builders
+    "SymptomBuilder": ".resources.symptom",
+    "ConditionBuilder": ".resources.condition",
+    "MedicationBuilder": ".resources.medication",
+    "DosageBuilder": ".resources.medication",
+    "PatientBuilder": ".resources.patient",
+    "IdentifierType": ".resources.patient",
+    "Gender": ".resources.patient",
+    "EncounterBuilder": ".resources.encounter",
+    "EncounterClass": ".resources.encounter",
+    "EncounterStatus": ".resources.encounter",
+    "ObservationBuilder": ".resources.observation",
+    "ObservationCategory": ".resources.observation",
+    "VitalSignCodes": ".resources.observation",
+    "ServiceRequestBuilder": ".resources.service_request",
+    "ServiceRequestCategory": ".resources.service_request",
+    "ServiceRequestStatus": ".resources.service_request",
+    "ServiceRequestPriority": ".resources.service_request",
+    "ProcedureBuilder": ".resources.procedure",
+    "ProcedureStatus": ".resources.procedure",
+    "FamilyMemberHistoryBuilder": ".resources.family_history",
+    "FamilyRelationship": ".resources.family_history",
+    "FamilyMemberHistoryStatus": ".resources.family_history",
+    "AllergyBuilder": ".resources.allergy",
+    "AllergyCategory": ".resources.allergy",
+    "AllergyType": ".resources.allergy",
+    "AllergyClinicalStatus": ".resources.allergy",
+    "AllergyCriticality": ".resources.allergy",
+    "ReactionSeverity": ".resources.allergy",
+    "ImmunizationBuilder": ".resources.immunization",
+    "ImmunizationStatus": ".resources.immunization",
+    "AppointmentBuilder": ".resources.appointment",
+    "AppointmentStatus": ".resources.appointment",
+    "ParticipantStatus": ".resources.appointment",
+    "AdviceBuilder": ".resources.care_plan",
+    "ClinicalNoteBuilder": ".resources.care_plan",
+    "CarePlanStatus": ".resources.care_plan",
+    "CommunicationStatus": ".resources.care_plan",
     
-    # Common clinical
-    Severity,
-    Laterality,
+    # Enums
+    "ObservationStatus": ".enums",
+    "FindingStatus": ".enums",
+    "Interpretation": ".enums",
+    "ConditionClinicalStatus": ".enums",
+    "ConditionVerificationStatus": ".enums",
+    "ConditionCategory": ".enums",
+    "Severity": ".enums",
+    "Laterality": ".enums",
+    "MedicationRequestStatus": ".enums",
+    "MedicationRequestIntent": ".enums",
+    "MedicationStatementStatus": ".enums",
+    "RouteOfAdministration": ".enums",
+    "EventTiming": ".enums",
     
-    # Medication-related
-    MedicationRequestStatus,
-    MedicationRequestIntent,
-    MedicationStatementStatus,
-    RouteOfAdministration,
-    EventTiming,
-)
-
-# Type helpers
-from .types import (
-    CodeInput,
-    DateTimeInput,
-    QuantityInput,
-    CodingSystem,
-    create_codeable_concept,
-    create_coding,
-    create_quantity,
-    create_period,
-    create_annotation,
-    create_reference,
-    parse_code_input,
-    parse_quantity_input,
-)
+    # Type helpers
+    "CodeInput": ".types",
+    "DateTimeInput": ".types",
+    "QuantityInput": ".types",
+    "CodingSystem": ".types",
+    "create_codeable_concept": ".types",
+    "create_coding": ".types",
+    "create_quantity": ".types",
+    "create_period": ".types",
+    "create_annotation": ".types",
+    "create_reference": ".types",
+    "parse_code_input": ".types",
+    "parse_code_input_fresh": ".types",
+    "parse_code_input_dict": ".types",
+    "parse_quantity_input": ".types",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __version__ = "0.1.0"
 
@@ -180,5 +279,7 @@ __all__ = [
     "create_annotation",
     "create_reference",
     "parse_code_input",
+    "parse_code_input_fresh",
+    "parse_code_input_dict",
     "parse_quantity_input",
 ]
@@ -34,8 +34,8 @@ Example:
     fhir_json = builder.convert_to_fhir()
 """
 
-import uuid
-from typing import Optional, List, Union, Dict, Any, Tuple
+import json
+from typing import Optional, Iterator, List, Union, Dict, Any, Tuple, TextIO
 from datetime import datetime
 
 from fhir.resources.bundle import Bundle, BundleEntry
@@ -70,13 +70,13 @@ from .enums import (
     MedicationStatementStatus,
     Interpretation,
 )
-from .types import CodeInput, DateTimeInput, create_reference
+from .types import CodeInput, DateTimeInput, create_model, create_reference, new_resource_id
 from .resources.symptom import SymptomBuilder
 from .resources.condition import ConditionBuilder
 from .resources.medication import MedicationBuilder, DosageBuilder
 from .resources.patient import PatientBuilder
 from .resources.encounter import EncounterBuilder, EncounterStatus
-from .resources.observation import ObservationBuilder
+from .resources.observation import ObservationBuilder, ObservationCategory
 from .resources.service_request import ServiceRequestBuilder, ServiceRequestPriority
 from .resources.procedure import ProcedureBuilder, ProcedureStatus
 from .resources.family_history import FamilyMemberHistoryBuilder
@@ -108,14 +108,37 @@ class FHIRDocumentBuilder:
     - Communications (notes)
     """
     
-    def __init__(self, bundle_id: Optional[str] = None):
+    # Resource list attributes, in bundle entry order (after the patient
+    # and encounter)
+    _RESOURCE_LISTS = (
+        "observations",
+        "conditions",
+        "medication_requests",
+        "medication_statements",
+        "service_requests",
+        "procedures",
+        "family_member_histories",
+        "allergies",
+        "immunizations",
+        "appointments",
+        "care_plans",
+        "communications",
+    )
+    
+    def __init__(self, bundle_id: Optional[str] = None, validate: bool = True):
         """
         Initialize a new FHIR Document Builder.
         
         Args:
             bundle_id: Optional ID for the bundle (auto-generated if not provided)
+            validate: Run pydantic validation in the resource builders that
+                      support it; pass False to build those resources from
+                      templates instead and check them all at once with
+                      validate() (faster for large documents)
         """
-        self.bundle_id = bundle_id or str(uuid.uuid4())
+        # Generated on first read (see the bundle_id property)
+        self._bundle_id = bundle_id
+        self._validate = validate
         
         # Core resources
         self.patient: Optional[Patient] = None
@@ -134,15 +157,36 @@ class FHIRDocumentBuilder:
         self.appointments: List[Appointment] = []
         self.care_plans: List[CarePlan] = []
         self.communications: List[Communication] = []
+        
+        # (resource, Reference) pairs, so every resource added for the same
+        # patient/encounter shares one Reference object
+        self._patient_reference: Optional[Tuple[Patient, Reference]] = None
+        self._encounter_reference: Optional[Tuple[Encounter, Reference]] = None
+    
+    @property
+    def bundle_id(self) -> str:
+        """Bundle ID; a UUID is generated on first access if none was given."""
+        if not self._bundle_id:
+            self._bundle_id = new_resource_id()
+        return self._bundle_id
+    
+    @bundle_id.setter
+    def bundle_id(self, value: str) -> None:
+        self._bundle_id = value
     
     def _get_patient_reference(self) -> Optional[Reference]:
         """Get a reference to the patient if one is set."""
+        cached = self._patient_reference
+        if cached is not None and cached[0] is self.patient:
+            return cached[1]
         if self.patient and self.patient.id:
-            return create_reference(
+            reference = create_reference(
                 resource_type="Patient",
                 resource_id=self.patient.id,
                 display=self._get_patient_display()
             )
+            self._patient_reference = (self.patient, reference)
+            return reference
         return None
     
     def _get_patient_display(self) -> Optional[str]:
@@ -161,11 +205,16 @@ class FHIRDocumentBuilder:
     
     def _get_encounter_reference(self) -> Optional[Reference]:
         """Get a reference to the encounter if one is set."""
+        cached = self._encounter_reference
+        if cached is not None and cached[0] is self.encounter:
+            return cached[1]
         if self.encounter and self.encounter.id:
-            return create_reference(
+            reference = create_reference(
                 resource_type="Encounter",
                 resource_id=self.encounter.id
             )
+            self._encounter_reference = (self.encounter, reference)
+            return reference
         return None
     
     # =========================================================================
@@ -210,6 +259,7 @@ class FHIRDocumentBuilder:
             address=address,
             phone=phone,
             email=email,
+            validate=self._validate,
             id=id,
         )
         return self.patient
@@ -394,6 +444,7 @@ class FHIRDocumentBuilder:
             notes=notes,
             subject_reference=self._get_patient_reference(),
             encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
             id=id,
         )
         
@@ -431,12 +482,71 @@ class FHIRDocumentBuilder:
             notes=notes,
             subject_reference=self._get_patient_reference(),
             encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
             id=id,
         )
         
         self.observations.append(observation)
         return observation
     
+    def add_vital_findings_batch(self, records: List[Dict[str, Any]]) -> List[Observation]:
+        """
+        Add several vital sign findings at once.
+        
+        Equivalent to calling add_vital_finding() for each record, but the
+        patient and encounter references are looked up once for the batch.
+        
+        Args:
+            records: One dict of add_vital_finding() keyword arguments
+                     (code, value, unit, date, interpretation, notes, id)
+                     per finding
+            
+        Returns:
+            The Observation resources, in record order
+            
+        Example:
+            builder.add_vital_findings_batch([
+                {"code": "Heart Rate", "value": 72, "unit": "bpm"},
+                {"code": "Body Temperature", "value": 98.6, "unit": "degF"},
+            ])
+        """
+        observations = ObservationBuilder.build_batch(
+            records,
+            category=ObservationCategory.VITAL_SIGNS,
+            subject_reference=self._get_patient_reference(),
+            encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
+        )
+        
+        self.observations.extend(observations)
+        return observations
+    
+    def add_lab_findings_batch(self, records: List[Dict[str, Any]]) -> List[Observation]:
+        """
+        Add several laboratory findings at once, e.g. one lab panel.
+        
+        Equivalent to calling add_lab_finding() for each record, but the
+        patient and encounter references are looked up once for the batch.
+        
+        Args:
+            records: One dict of add_lab_finding() keyword arguments
+                     (code, value, unit, date, interpretation, notes, id)
+                     per finding
+            
+        Returns:
+            The Observation resources, in record order
+        """
+        observations = ObservationBuilder.build_batch(
+            records,
+            category=ObservationCategory.LABORATORY,
+            subject_reference=self._get_patient_reference(),
+            encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
+        )
+        
+        self.observations.extend(observations)
+        return observations
+    
     def add_examination_finding(
         self,
         code: CodeInput,
@@ -465,6 +575,7 @@ class FHIRDocumentBuilder:
             notes=notes,
             subject_reference=self._get_patient_reference(),
             encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
             id=id,
         )
         
@@ -498,6 +609,7 @@ class FHIRDocumentBuilder:
             date=date,
             subject_reference=self._get_patient_reference(),
             encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
             id=id,
         )
         
@@ -679,6 +791,7 @@ class FHIRDocumentBuilder:
             outcome=outcome,
             subject_reference=self._get_patient_reference(),
             encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
             id=id,
         )
         
@@ -760,6 +873,7 @@ class FHIRDocumentBuilder:
             notes=notes,
             subject_reference=self._get_patient_reference(),
             encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
             id=id,
         )
         
@@ -801,6 +915,7 @@ class FHIRDocumentBuilder:
             notes=notes,
             subject_reference=self._get_patient_reference(),
             encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
             id=id,
         )
         
@@ -864,6 +979,7 @@ class FHIRDocumentBuilder:
             category=category,
             subject_reference=self._get_patient_reference(),
             encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
             id=id,
         )
         
@@ -889,6 +1005,7 @@ class FHIRDocumentBuilder:
             category=category,
             subject_reference=self._get_patient_reference(),
             encounter_reference=self._get_encounter_reference(),
+            validate=self._validate,
             id=id,
         )
         
@@ -899,13 +1016,49 @@ class FHIRDocumentBuilder:
     # BUNDLE GENERATION
     # =========================================================================
     
+    def validate(self) -> None:
+        """
+        Validate every added resource.
+        
+        Meant for builders created with validate=False: each resource is
+        checked once here instead of while it is added. Resources are not
+        modified.
+        
+        Raises:
+            pydantic.ValidationError: If a resource is not valid FHIR
+        """
+        for resource in self._iter_resources():
+            type(resource).model_validate(resource.model_dump())
+    
+    def _iter_resources(self) -> Iterator[Resource]:
+        """Yield every added resource in bundle entry order."""
+        if self.patient:
+            yield self.patient
+        if self.encounter:
+            yield self.encounter
+        for name in self._RESOURCE_LISTS:
+            yield from getattr(self, name)
+    
     def _create_bundle_entry(self, resource: Resource) -> BundleEntry:
         """Create a bundle entry for a resource."""
-        return BundleEntry(
+        # The resource is already built, so the wrapper is not re-validated
+        return create_model(
+            BundleEntry,
+            False,
             fullUrl=f"urn:uuid:{resource.id}",
             resource=resource
         )
     
+    def _build_bundle(self, bundle_type: str = "collection") -> Bundle:
+        """Create a Bundle holding an entry for every added resource."""
+        entries = [self._create_bundle_entry(resource) for resource in self._iter_resources()]
+        return Bundle(
+            id=self.bundle_id,
+            type=bundle_type,
+            timestamp=datetime.utcnow().isoformat() + "Z",
+            entry=entries if entries else None
+        )
+    
     def convert_to_fhir(self, bundle_type: str = "collection") -> Dict[str, Any]:
         """
         Convert all added resources to a FHIR Bundle.
@@ -916,126 +1069,51 @@ class FHIRDocumentBuilder:
         Returns:
             Dictionary representation of the FHIR Bundle
         """
-        entries = []
-        
-        # Core resources
-        if self.patient:
-            entries.append(self._create_bundle_entry(self.patient))
-        
-        if self.encounter:
-            entries.append(self._create_bundle_entry(self.encounter))
-        
-        # Observations
-        for observation in self.observations:
-            entries.append(self._create_bundle_entry(observation))
-        
-        # Conditions
-        for condition in self.conditions:
-            entries.append(self._create_bundle_entry(condition))
-        
-        # Medications
-        for medication_request in self.medication_requests:
-            entries.append(self._create_bundle_entry(medication_request))
-        
-        for medication_statement in self.medication_statements:
-            entries.append(self._create_bundle_entry(medication_statement))
-        
-        # Service Requests
-        for service_request in self.service_requests:
-            entries.append(self._create_bundle_entry(service_request))
-        
-        # Procedures
-        for procedure in self.procedures:
-            entries.append(self._create_bundle_entry(procedure))
-        
-        # Family History
-        for family_history in self.family_member_histories:
-            entries.append(self._create_bundle_entry(family_history))
-        
-        # Allergies
-        for allergy in self.allergies:
-            entries.append(self._create_bundle_entry(allergy))
-        
-        # Immunizations
-        for immunization in self.immunizations:
-            entries.append(self._create_bundle_entry(immunization))
-        
-        # Appointments
-        for appointment in self.appointments:
-            entries.append(self._create_bundle_entry(appointment))
-        
-        # Care Plans (Advice)
-        for care_plan in self.care_plans:
-            entries.append(self._create_bundle_entry(care_plan))
-        
-        # Communications (Notes)
-        for communication in self.communications:
-            entries.append(self._create_bundle_entry(communication))
-        
-        # Create the bundle
-        bundle = Bundle(
-            id=self.bundle_id,
-            type=bundle_type,
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            entry=entries if entries else None
-        )
-        
+        bundle = self._build_bundle(bundle_type)
         return bundle.model_dump(mode='json', exclude_none=True)
     
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
-        import json
         return json.dumps(self.convert_to_fhir(), indent=indent)
     
-    def get_bundle(self) -> Bundle:
-        """Get the Bundle object directly."""
-        entries = []
-        
-        if self.patient:
-            entries.append(self._create_bundle_entry(self.patient))
-        
-        if self.encounter:
-            entries.append(self._create_bundle_entry(self.encounter))
-        
-        for observation in self.observations:
-            entries.append(self._create_bundle_entry(observation))
-        
-        for condition in self.conditions:
-            entries.append(self._create_bundle_entry(condition))
-        
-        for medication_request in self.medication_requests:
-            entries.append(self._create_bundle_entry(medication_request))
-        
-        for medication_statement in self.medication_statements:
-            entries.append(self._create_bundle_entry(medication_statement))
-        
-        for service_request in self.service_requests:
-            entries.append(self._create_bundle_entry(service_request))
-        
-        for procedure in self.procedures:
-            entries.append(self._create_bundle_entry(procedure))
-        
-        for family_history in self.family_member_histories:
-            entries.append(self._create_bundle_entry(family_history))
-        
-        for allergy in self.allergies:
-            entries.append(self._create_bundle_entry(allergy))
-        
-        for immunization in self.immunizations:
-            entries.append(self._create_bundle_entry(immunization))
-        
-        for appointment in self.appointments:
-            entries.append(self._create_bundle_entry(appointment))
+    def stream_bundle(self, fp: TextIO, bundle_type: str = "collection") -> None:
+        """
+        Write the FHIR Bundle as JSON to a text file-like object.
         
-        for care_plan in self.care_plans:
-            entries.append(self._create_bundle_entry(care_plan))
+        Produces the same document as convert_to_fhir(), but serializes one
+        entry at a time, so the whole bundle is never held in memory.
         
-        for communication in self.communications:
-            entries.append(self._create_bundle_entry(communication))
+        Args:
+            fp: Object with a write(str) method (open file, StringIO, response stream)
+            bundle_type: Type of bundle (collection, document, transaction, etc.)
+        """
+        header = json.dumps({
+            "resourceType": "Bundle",
+            "id": self.bundle_id,
+            "type": bundle_type,
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+        })
+        fp.write(header[:-1])
+        separator = ', "entry": ['
+        for resource in self._iter_resources():
+            fp.write(separator)
+            fp.write(json.dumps({
+                "fullUrl": f"urn:uuid:{resource.id}",
+                "resource": resource.model_dump(mode='json', exclude_none=True)
+            }))
+            separator = ", "
+        fp.write("]}" if separator == ", " else "}")
+    
+    def iter_ndjson(self) -> Iterator[str]:
+        """
+        Yield every added resource as one line of newline-delimited JSON.
         
-        return Bundle(
-            id=self.bundle_id,
-            type="collection",
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            entry=entries if entries else None
-        )
+        Lines are produced lazily in bundle entry order, which suits FHIR bulk
+        data ($export) style output and streaming HTTP responses.
+        """
+        for resource in self._iter_resources():
+            yield json.dumps(resource.model_dump(mode='json', exclude_none=True)) + "\n"
+    
+    def get_bundle(self) -> Bundle:
+        """Get the Bundle object directly."""
+        return self._build_bundle()
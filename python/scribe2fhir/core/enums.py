@@ -4,7 +4,21 @@ FHIR SDK Enums - Standard value sets for FHIR resources.
 These enums map to FHIR terminology CodeSystems and ValueSets.
 """
 
+import sys
 from enum import Enum
+from types import MappingProxyType
+
+
+class CodeEnum(str, Enum):
+    """
+    Base for code enums that replace plain string constants.
+
+    Members render as their code in str() and format() on every Python
+    version, like the constants they replaced (a plain (str, Enum) gives
+    "Class.MEMBER" from str(), and from format() too on 3.11+).
+    """
+    __str__ = str.__str__
+    __format__ = str.__format__
 
 
 # =============================================================================
@@ -74,17 +88,22 @@ class Severity(str, Enum):
     @property
     def snomed_code(self) -> str:
         """Get SNOMED CT code for severity."""
-        codes = {
-            "mild": "255604002",
-            "moderate": "6736007",
-            "severe": "24484000",
-        }
-        return codes[self.value]
+        return self._SNOMED[self]
 
     @property
     def display(self) -> str:
         """Get display text for severity."""
-        return self.value.capitalize()
+        return self._DISPLAY[self]
+
+
+Severity._SNOMED = MappingProxyType({
+    Severity.MILD: "255604002",
+    Severity.MODERATE: "6736007",
+    Severity.SEVERE: "24484000",
+})
+Severity._DISPLAY = MappingProxyType({
+    member: sys.intern(member.value.capitalize()) for member in Severity
+})
 
 
 # =============================================================================
@@ -100,17 +119,22 @@ class Laterality(str, Enum):
     @property
     def snomed_code(self) -> str:
         """Get SNOMED CT code for laterality."""
-        codes = {
-            "left": "7771000",
-            "right": "24028007",
-            "bilateral": "51440002",
-        }
-        return codes[self.value]
+        return self._SNOMED[self]
 
     @property
     def display(self) -> str:
         """Get display text for laterality."""
-        return self.value.capitalize()
+        return self._DISPLAY[self]
+
+
+Laterality._SNOMED = MappingProxyType({
+    Laterality.LEFT: "7771000",
+    Laterality.RIGHT: "24028007",
+    Laterality.BILATERAL: "51440002",
+})
+Laterality._DISPLAY = MappingProxyType({
+    member: sys.intern(member.value.capitalize()) for member in Laterality
+})
 
 
 # =============================================================================
@@ -179,17 +203,19 @@ class Interpretation(str, Enum):
     @property
     def display(self) -> str:
         """Get display text for interpretation."""
-        displays = {
-            "N": "Normal",
-            "A": "Abnormal",
-            "L": "Low",
-            "H": "High",
-            "LL": "Critical Low",
-            "HH": "Critical High",
-            "POS": "Positive",
-            "NEG": "Negative",
-        }
-        return displays[self.value]
+        return self._DISPLAY[self]
+
+
+Interpretation._DISPLAY = MappingProxyType({
+    Interpretation.NORMAL: "Normal",
+    Interpretation.ABNORMAL: "Abnormal",
+    Interpretation.LOW: "Low",
+    Interpretation.HIGH: "High",
+    Interpretation.CRITICAL_LOW: "Critical Low",
+    Interpretation.CRITICAL_HIGH: "Critical High",
+    Interpretation.POSITIVE: "Positive",
+    Interpretation.NEGATIVE: "Negative",
+})
 
 
 # =============================================================================
@@ -248,26 +274,97 @@ class RouteOfAdministration(str, Enum):
     @property
     def snomed_code(self) -> str:
         """Get SNOMED CT code for route."""
-        codes = {
-            "oral": "26643006",
-            "intravenous": "47625008",
-            "intramuscular": "78421000",
-            "subcutaneous": "34206005",
-            "topical": "6064005",
-            "inhalation": "18679011000001101",
-            "nasal": "46713006",
-            "ophthalmic": "54485002",
-            "otic": "10547007",
-            "rectal": "37161004",
-            "sublingual": "37839007",
-            "transdermal": "45890007",
-            "vaginal": "16857009",
-        }
-        return codes[self.value]
+        return self._SNOMED[self]
 
     @property
     def display(self) -> str:
         """Get display text for route."""
-        return self.value.capitalize()
+        return self._DISPLAY[self]
+
+
+RouteOfAdministration._SNOMED = MappingProxyType({
+    RouteOfAdministration.ORAL: "26643006",
+    RouteOfAdministration.INTRAVENOUS: "47625008",
+    RouteOfAdministration.INTRAMUSCULAR: "78421000",
+    RouteOfAdministration.SUBCUTANEOUS: "34206005",
+    RouteOfAdministration.TOPICAL: "6064005",
+    RouteOfAdministration.INHALATION: "18679011000001101",
+    RouteOfAdministration.NASAL: "46713006",
+    RouteOfAdministration.OPHTHALMIC: "54485002",
+    RouteOfAdministration.OTIC: "10547007",
+    RouteOfAdministration.RECTAL: "37161004",
+    RouteOfAdministration.SUBLINGUAL: "37839007",
+    RouteOfAdministration.TRANSDERMAL: "45890007",
+    RouteOfAdministration.VAGINAL: "16857009",
+})
+RouteOfAdministration._DISPLAY = MappingProxyType({
+    member: sys.intern(member.value.capitalize()) for member in RouteOfAdministration
+})
 
 
+# =============================================================================
+# VALUE LOOKUPS
+# Read-only value -> member maps so builders can coerce user strings with a
+# single dict lookup instead of going through Enum.__call__, plus a tuple of
+# members in definition order for positional access. Member values are
+# interned so comparisons against other interned codes hit the identity
+# fast path.
+# =============================================================================
+# Member -> interned value, for code_value()
+_CODE_VALUES = {}
+
+
+def _register_code_enums(*enum_classes):
+    """
+    Intern the member values of each code enum and attach its LOOKUP map
+    and _MEMBERS tuple. Also used by the resource modules for their own
+    code enums, so code_value() covers every one of them.
+    """
+    for enum_cls in enum_classes:
+        for member in enum_cls:
+            member._value_ = sys.intern(member._value_)
+            _CODE_VALUES[member] = member._value_
+        enum_cls.LOOKUP = MappingProxyType(enum_cls._value2member_map_)
+        enum_cls._MEMBERS = tuple(enum_cls)
+
+
+def code_value(code):
+    """
+    Return the interned code string for an enum member; other values
+    (plain strings) are returned unchanged.
+
+    One dict lookup, cheaper than an isinstance check plus the Enum.value
+    property.
+    """
+    return _CODE_VALUES.get(code, code)
+
+
+def coerce_code(enum_cls, value):
+    """
+    Return value as a member of enum_cls. Strings are matched
+    case-insensitively against the member values.
+
+    Raises:
+        ValueError: If the string is not a code of enum_cls
+    """
+    if isinstance(value, enum_cls):
+        return value
+    code = value.lower()
+    return enum_cls.LOOKUP.get(code) or enum_cls(code)
+
+
+_register_code_enums(
+    ObservationStatus,
+    ConditionClinicalStatus,
+    ConditionVerificationStatus,
+    ConditionCategory,
+    Severity,
+    Laterality,
+    MedicationRequestStatus,
+    MedicationRequestIntent,
+    MedicationStatementStatus,
+    Interpretation,
+    FindingStatus,
+    EventTiming,
+    RouteOfAdministration,
+)
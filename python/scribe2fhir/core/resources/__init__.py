@@ -2,19 +2,81 @@
 FHIR SDK Resources - Resource builders for various FHIR resource types.
 """
 
-from .symptom import SymptomBuilder
-from .condition import ConditionBuilder
-from .medication import MedicationBuilder, DosageBuilder
-from .patient import PatientBuilder, IdentifierType, Gender
-from .encounter import EncounterBuilder, EncounterClass, EncounterStatus
-from .observation import ObservationBuilder, ObservationCategory, VitalSignCodes
-from .service_request import ServiceRequestBuilder, ServiceRequestCategory, ServiceRequestStatus, ServiceRequestPriority
-from .procedure import ProcedureBuilder, ProcedureStatus
-from .family_history import FamilyMemberHistoryBuilder, FamilyRelationship, FamilyMemberHistoryStatus
-from .allergy import AllergyBuilder, AllergyCategory, AllergyType, AllergyClinicalStatus, AllergyCriticality, ReactionSeverity
-from .immunization import ImmunizationBuilder, ImmunizationStatus
-from .appointment import AppointmentBuilder, AppointmentStatus, ParticipantStatus
-from .care_plan import AdviceBuilder, ClinicalNoteBuilder, CarePlanStatus, CommunicationStatus
+# Builders are imported on first access (PEP 562), so importing one
+# builder module does not load every other fhir.resources model
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .symptom import SymptomBuilder
+    from .condition import ConditionBuilder
+    from .medication import MedicationBuilder, DosageBuilder
+    from .patient import PatientBuilder, IdentifierType, Gender
+    from .encounter import EncounterBuilder, EncounterClass, EncounterStatus
+    from .observation import ObservationBuilder, ObservationCategory, VitalSignCodes
+    from .service_request import ServiceRequestBuilder, ServiceRequestCategory, ServiceRequestStatus, ServiceRequestPriority
+    from .procedure import ProcedureBuilder, ProcedureStatus
+    from .family_history import FamilyMemberHistoryBuilder, FamilyRelationship, FamilyMemberHistoryStatus
+    from .allergy import AllergyBuilder, AllergyCategory, AllergyType, AllergyClinicalStatus, AllergyCriticality, ReactionSeverity
+    from .immunization import ImmunizationBuilder, ImmunizationStatus
+    from .appointment import AppointmentBuilder, AppointmentStatus, ParticipantStatus
+    from .care_plan import AdviceBuilder, ClinicalNoteBuilder, CarePlanStatus, CommunicationStatus
+
+
+_LAZY_IMPORTS = {
+    "SymptomBuilder": ".symptom",
+    "ConditionBuilder": ".condition",
+    "MedicationBuilder": ".medication",
+    "DosageBuilder": ".medication",
+    "PatientBuilder": ".patient",
+    "IdentifierType": ".patient",
+    "Gender": ".patient",
+    "EncounterBuilder": ".encounter",
+    "EncounterClass": ".encounter",
+    "EncounterStatus": ".encounter",
+    "ObservationBuilder": ".observation",
+    "ObservationCategory": ".observation",
+    "VitalSignCodes": ".observation",
+    "ServiceRequestBuilder": ".service_request",
+    "ServiceRequestCategory": ".service_request",
+    "ServiceRequestStatus": ".service_request",
+    "ServiceRequestPriority": ".service_request",
+    "ProcedureBuilder": ".procedure",
+    "ProcedureStatus": ".procedure",
+    "FamilyMemberHistoryBuilder": ".family_history",
+    "FamilyRelationship": ".family_history",
+    "FamilyMemberHistoryStatus": ".family_history",
+    "AllergyBuilder": ".allergy",
+    "AllergyCategory": ".allergy",
+    "AllergyType": ".allergy",
+    "AllergyClinicalStatus": ".allergy",
+    "AllergyCriticality": ".allergy",
+    "ReactionSeverity": ".allergy",
+    "ImmunizationBuilder": ".immunization",
+    "ImmunizationStatus": ".immunization",
+    "AppointmentBuilder": ".appointment",
+    "AppointmentStatus": ".appointment",
+    "ParticipantStatus": ".appointment",
+    "AdviceBuilder": ".care_plan",
+    "ClinicalNoteBuilder": ".care_plan",
+    "CarePlanStatus": ".care_plan",
+    "CommunicationStatus": ".care_plan",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Symptom
@@ -12,7 +12,9 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/allergyintolerance.html
 """
 
-import uuid
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, List, Union
 from datetime import datetime
 
@@ -22,16 +24,19 @@ from fhir.resources.coding import Coding
 from fhir.resources.reference import Reference
 from fhir.resources.annotation import Annotation
 
+from ..enums import CodeEnum, _register_code_enums
 from ..types import (
     CodeInput,
     DateTimeInput,
     CodingSystem,
     parse_code_input,
     format_datetime,
+    create_model,
+    new_resource_id,
 )
 
 
-class AllergyCategory:
+class AllergyCategory(CodeEnum):
     """Allergy category codes."""
     FOOD = "food"
     MEDICATION = "medication"
@@ -39,27 +44,27 @@ class AllergyCategory:
     BIOLOGIC = "biologic"
 
 
-class AllergyType:
+class AllergyType(CodeEnum):
     """Allergy type codes."""
     ALLERGY = "allergy"
     INTOLERANCE = "intolerance"
 
 
-class AllergyCriticality:
+class AllergyCriticality(CodeEnum):
     """Allergy criticality codes."""
     LOW = "low"
     HIGH = "high"
     UNABLE_TO_ASSESS = "unable-to-assess"
 
 
-class AllergyClinicalStatus:
+class AllergyClinicalStatus(CodeEnum):
     """Allergy clinical status codes."""
     ACTIVE = "active"
     INACTIVE = "inactive"
     RESOLVED = "resolved"
 
 
-class AllergyVerificationStatus:
+class AllergyVerificationStatus(CodeEnum):
     """Allergy verification status codes."""
     UNCONFIRMED = "unconfirmed"
     CONFIRMED = "confirmed"
@@ -67,13 +72,34 @@ class AllergyVerificationStatus:
     ENTERED_IN_ERROR = "entered-in-error"
 
 
-class ReactionSeverity:
+class ReactionSeverity(CodeEnum):
     """Reaction severity codes."""
     MILD = "mild"
     MODERATE = "moderate"
     SEVERE = "severe"
 
 
+_register_code_enums(
+    AllergyCategory,
+    AllergyType,
+    AllergyCriticality,
+    AllergyClinicalStatus,
+    AllergyVerificationStatus,
+    ReactionSeverity,
+)
+
+
+# Display text for the known clinical/verification status codes
+_STATUS_DISPLAY = MappingProxyType({
+    member.value: sys.intern(member.value.capitalize())
+    for status_cls in (AllergyClinicalStatus, AllergyVerificationStatus)
+    for member in status_cls
+})
+
+# Placeholder manifestation for reactions given only a severity (shared, read-only)
+_UNKNOWN_MANIFESTATION = CodeableConcept(text="Unknown")
+
+
 class AllergyBuilder:
     """
     Builder for creating FHIR AllergyIntolerance resources.
@@ -104,29 +130,13 @@ class AllergyBuilder:
     
     @staticmethod
     def _create_clinical_status(status: str) -> CodeableConcept:
-        """Create clinical status CodeableConcept."""
-        return CodeableConcept(
-            coding=[
-                Coding(
-                    system=AllergyBuilder.CLINICAL_STATUS_SYSTEM,
-                    code=status,
-                    display=status.capitalize()
-                )
-            ]
-        )
+        """Create clinical status CodeableConcept (shared, treat as read-only)."""
+        return _clinical_status_concept(status)
     
     @staticmethod
     def _create_verification_status(status: str) -> CodeableConcept:
-        """Create verification status CodeableConcept."""
-        return CodeableConcept(
-            coding=[
-                Coding(
-                    system=AllergyBuilder.VERIFICATION_STATUS_SYSTEM,
-                    code=status,
-                    display=status.capitalize()
-                )
-            ]
-        )
+        """Create verification status CodeableConcept (shared, treat as read-only)."""
+        return _verification_status_concept(status)
     
     @staticmethod
     def build(
@@ -145,6 +155,8 @@ class AllergyBuilder:
         recorder_reference: Optional[Reference] = None,
         recorded_date: Optional[DateTimeInput] = None,
         id: Optional[str] = None,
+        generate_id: bool = True,
+        validate: bool = True,
     ) -> AllergyIntolerance:
         """
         Build a FHIR AllergyIntolerance resource.
@@ -165,6 +177,11 @@ class AllergyBuilder:
             recorder_reference: Reference to who recorded
             recorded_date: When this was recorded
             id: Resource ID
+            generate_id: Generate a UUID when no id is given; pass False
+                         to leave the id unset (e.g. for server-assigned ids)
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
             FHIR AllergyIntolerance resource
@@ -186,7 +203,7 @@ class AllergyBuilder:
             )
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or (new_resource_id() if generate_id else None)
         
         # Parse allergen code
         allergen_code = parse_code_input(code)
@@ -207,21 +224,20 @@ class AllergyBuilder:
         # Build reaction
         reactions = None
         if reaction_manifestation or reaction_severity:
-            reaction = AllergyIntoleranceReaction()
-            
-            if reaction_manifestation:
-                if isinstance(reaction_manifestation, str):
-                    reaction.manifestation = [CodeableConcept(text=reaction_manifestation)]
-                else:
-                    reaction.manifestation = [parse_code_input(reaction_manifestation)]
-            else:
+            if not reaction_manifestation:
                 # Manifestation is required if reaction is present
-                reaction.manifestation = [CodeableConcept(text="Unknown")]
-            
-            if reaction_severity:
-                reaction.severity = reaction_severity
+                manifestation = [_UNKNOWN_MANIFESTATION]
+            elif isinstance(reaction_manifestation, str):
+                manifestation = [CodeableConcept(text=reaction_manifestation)]
+            else:
+                manifestation = [parse_code_input(reaction_manifestation)]
             
-            reactions = [reaction]
+            reactions = [
+                AllergyIntoleranceReaction(
+                    manifestation=manifestation,
+                    severity=reaction_severity or None
+                )
+            ]
         
         # Build notes
         note = None
@@ -229,20 +245,25 @@ class AllergyBuilder:
             note = [Annotation(text=notes)]
         
         # Create the AllergyIntolerance resource
-        allergy = AllergyIntolerance(
-            id=resource_id,
-            clinicalStatus=clinical_status_concept,
-            verificationStatus=verification_status_concept,
-            type=allergy_type,
-            category=category_list,
-            criticality=criticality,
-            code=allergen_code,
-            patient=subject_reference,
-            encounter=encounter_reference,
-            onsetDateTime=format_datetime(onset) if onset else None,
-            recordedDate=format_datetime(recorded_date) if recorded_date else None,
-            reaction=reactions,
-            note=note,
+        allergy_kwargs = {
+            "id": resource_id,
+            "clinicalStatus": clinical_status_concept,
+            "verificationStatus": verification_status_concept,
+            "type": allergy_type,
+            "category": category_list,
+            "criticality": criticality,
+            "code": allergen_code,
+            "encounter": encounter_reference,
+            "onsetDateTime": format_datetime(onset) if onset else None,
+            "recordedDate": format_datetime(recorded_date) if recorded_date else None,
+            "reaction": reactions,
+            "note": note,
+        }
+        # patient is a required element, so it is always passed (even as None);
+        # optional elements are only passed when set
+        allergy_kwargs = {k: v for k, v in allergy_kwargs.items() if v is not None}
+        allergy = create_model(
+            AllergyIntolerance, validate, patient=subject_reference, **allergy_kwargs
         )
         
         return allergy
@@ -310,3 +331,30 @@ class AllergyBuilder:
         )
 
 
+# Bounded: status strings come from the caller, not only the known codes
+@lru_cache(maxsize=64)
+def _clinical_status_concept(status: str) -> CodeableConcept:
+    """Build the clinical status CodeableConcept once per status code."""
+    return CodeableConcept(
+        coding=[
+            Coding(
+                system=AllergyBuilder.CLINICAL_STATUS_SYSTEM,
+                code=status,
+                display=_STATUS_DISPLAY.get(status) or status.capitalize()
+            )
+        ]
+    )
+
+
+@lru_cache(maxsize=64)
+def _verification_status_concept(status: str) -> CodeableConcept:
+    """Build the verification status CodeableConcept once per status code."""
+    return CodeableConcept(
+        coding=[
+            Coding(
+                system=AllergyBuilder.VERIFICATION_STATUS_SYSTEM,
+                code=status,
+                display=_STATUS_DISPLAY.get(status) or status.capitalize()
+            )
+        ]
+    )
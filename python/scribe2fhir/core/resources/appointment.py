@@ -11,26 +11,28 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/appointment.html
 """
 
-import uuid
 from typing import Optional, List, Union
 from datetime import datetime
 
 from fhir.resources.appointment import Appointment, AppointmentParticipant
 from fhir.resources.codeableconcept import CodeableConcept
+from fhir.resources.codeablereference import CodeableReference
 from fhir.resources.coding import Coding
 from fhir.resources.reference import Reference
 from fhir.resources.annotation import Annotation
 
+from ..enums import CodeEnum, _register_code_enums
 from ..types import (
     CodeInput,
     DateTimeInput,
     CodingSystem,
     parse_code_input,
     format_datetime,
+    new_resource_id,
 )
 
 
-class AppointmentStatus:
+class AppointmentStatus(CodeEnum):
     """Appointment status codes."""
     PROPOSED = "proposed"
     PENDING = "pending"
@@ -44,7 +46,7 @@ class AppointmentStatus:
     WAITLIST = "waitlist"
 
 
-class ParticipantStatus:
+class ParticipantStatus(CodeEnum):
     """Participant status in an appointment."""
     ACCEPTED = "accepted"
     DECLINED = "declined"
@@ -52,6 +54,12 @@ class ParticipantStatus:
     NEEDS_ACTION = "needs-action"
 
 
+_register_code_enums(
+    AppointmentStatus,
+    ParticipantStatus,
+)
+
+
 class AppointmentBuilder:
     """
     Builder for creating FHIR Appointment resources.
@@ -85,6 +93,7 @@ class AppointmentBuilder:
         practitioner_name: Optional[str] = None,
         location_reference: Optional[Reference] = None,
         id: Optional[str] = None,
+        generate_id: bool = True,
     ) -> Appointment:
         """
         Build a FHIR Appointment resource.
@@ -105,6 +114,8 @@ class AppointmentBuilder:
             practitioner_name: Name of practitioner (if no reference)
             location_reference: Reference to location
             id: Resource ID
+            generate_id: Generate a UUID when no id is given; pass False
+                         to leave the id unset (e.g. for server-assigned ids)
             
         Returns:
             FHIR Appointment resource
@@ -119,12 +130,7 @@ class AppointmentBuilder:
             )
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
-        
-        # Build service type
-        service_type_list = None
-        if service_type:
-            service_type_list = [parse_code_input(service_type)]
+        resource_id = id or (new_resource_id() if generate_id else None)
         
         # Build specialty
         specialty_list = None
@@ -136,59 +142,28 @@ class AppointmentBuilder:
         if appointment_type:
             appointment_type_concept = parse_code_input(appointment_type)
         
-        # Build reason
-        reason_code = None
-        if reason:
-            reason_code = [parse_code_input(reason)]
-        
-        # Build participants
-        participants = []
-        
-        # Add patient
-        if patient_reference:
-            participants.append(
-                AppointmentParticipant(
-                    actor=patient_reference,
-                    status=ParticipantStatus.ACCEPTED
-                )
-            )
-        
-        # Add practitioner
-        if practitioner_reference or practitioner_name:
-            actor = practitioner_reference or Reference(display=practitioner_name)
-            participants.append(
-                AppointmentParticipant(
-                    actor=actor,
-                    status=ParticipantStatus.ACCEPTED
-                )
-            )
-        
-        # Add location
-        if location_reference:
-            participants.append(
-                AppointmentParticipant(
-                    actor=location_reference,
-                    status=ParticipantStatus.ACCEPTED
-                )
-            )
-        
-        # Build comment/notes
-        comment = None
-        if notes:
-            comment = notes
+        # Build participants (patient, practitioner, location), all accepted
+        actors = (
+            patient_reference,
+            practitioner_reference or (Reference(display=practitioner_name) if practitioner_name else None),
+            location_reference,
+        )
+        participants = [
+            AppointmentParticipant(actor=actor, status=ParticipantStatus.ACCEPTED)
+            for actor in actors
+            if actor is not None
+        ]
         
         # Prepare R5 compatible fields
-        from fhir.resources.codeablereference import CodeableReference
-        
         # serviceType is List[CodeableReference] in R5
         service_type_val = None
-        if service_type_list:
-            service_type_val = [CodeableReference(concept=st) for st in service_type_list]
+        if service_type:
+            service_type_val = [CodeableReference(concept=parse_code_input(service_type))]
 
         # reason is List[CodeableReference] in R5
         reason_val = None
-        if reason_code:
-            reason_val = [CodeableReference(concept=rc) for rc in reason_code]
+        if reason:
+            reason_val = [CodeableReference(concept=parse_code_input(reason))]
             
         # comments are notes in R5
         note_val = None
@@ -196,19 +171,24 @@ class AppointmentBuilder:
             note_val = [Annotation(text=notes)]
 
         # Create the Appointment resource
+        appointment_kwargs = {
+            "id": resource_id,
+            "status": status,
+            "serviceType": service_type_val,
+            "specialty": specialty_list,
+            "appointmentType": appointment_type_concept,
+            "reason": reason_val,
+            "description": description,
+            "start": format_datetime(start) if start else None,
+            "end": format_datetime(end) if end else None,
+            "minutesDuration": minutes_duration,
+            "note": note_val,
+        }
+        # participant is a required element, so it is always passed;
+        # optional elements are only passed when set
         appointment = Appointment(
-            id=resource_id,
-            status=status,
-            serviceType=service_type_val,
-            specialty=specialty_list,
-            appointmentType=appointment_type_concept,
-            reason=reason_val,
-            description=description,
-            start=format_datetime(start) if start else None,
-            end=format_datetime(end) if end else None,
-            minutesDuration=minutes_duration,
             participant=participants,
-            note=note_val,
+            **{k: v for k, v in appointment_kwargs.items() if v is not None}
         )
         
         return appointment
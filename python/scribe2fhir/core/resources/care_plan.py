@@ -20,7 +20,6 @@ Reference:
 - https://www.hl7.org/fhir/communication.html
 """
 
-import uuid
 from typing import Optional, List, Union
 from datetime import datetime
 
@@ -32,16 +31,19 @@ from fhir.resources.coding import Coding
 from fhir.resources.reference import Reference
 from fhir.resources.annotation import Annotation
 
+from ..enums import CodeEnum, _register_code_enums
 from ..types import (
     CodeInput,
     DateTimeInput,
     CodingSystem,
     parse_code_input,
     format_datetime,
+    create_model,
+    new_resource_id,
 )
 
 
-class CarePlanStatus:
+class CarePlanStatus(CodeEnum):
     """CarePlan status codes."""
     DRAFT = "draft"
     ACTIVE = "active"
@@ -52,7 +54,7 @@ class CarePlanStatus:
     UNKNOWN = "unknown"
 
 
-class CarePlanIntent:
+class CarePlanIntent(CodeEnum):
     """CarePlan intent codes."""
     PROPOSAL = "proposal"
     PLAN = "plan"
@@ -60,7 +62,7 @@ class CarePlanIntent:
     OPTION = "option"
 
 
-class CommunicationStatus:
+class CommunicationStatus(CodeEnum):
     """Communication status codes."""
     PREPARATION = "preparation"
     IN_PROGRESS = "in-progress"
@@ -72,6 +74,13 @@ class CommunicationStatus:
     UNKNOWN = "unknown"
 
 
+_register_code_enums(
+    CarePlanStatus,
+    CarePlanIntent,
+    CommunicationStatus,
+)
+
+
 class AdviceBuilder:
     """
     Builder for creating FHIR CarePlan resources for patient advice.
@@ -100,6 +109,8 @@ class AdviceBuilder:
         encounter_reference: Optional[Reference] = None,
         author_reference: Optional[Reference] = None,
         id: Optional[str] = None,
+        generate_id: bool = True,
+        validate: bool = True,
     ) -> CarePlan:
         """
         Build a FHIR CarePlan resource for patient advice.
@@ -115,6 +126,11 @@ class AdviceBuilder:
             encounter_reference: Reference to encounter
             author_reference: Reference to author
             id: Resource ID
+            generate_id: Generate a UUID when no id is given; pass False
+                         to leave the id unset (e.g. for server-assigned ids)
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
             FHIR CarePlan resource
@@ -127,25 +143,27 @@ class AdviceBuilder:
             )
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or (new_resource_id() if generate_id else None)
         
         # Build category
         category_list = None
         if category:
-            category_list = [
-                CodeableConcept(
-                    text=category
-                )
-            ]
+            # Category texts repeat across resources; share one cached concept
+            category_list = [parse_code_input(category)]
         
         # Build activity with the advice using progress note
-        # In FHIR R5/newer versions, CarePlanActivity uses progress for notes
-        activity = CarePlanActivity(
-            progress=[Annotation(text=advice_text)]
+        # In FHIR R5/newer versions, CarePlanActivity uses progress for notes;
+        # the activity only wraps the already-built note, so skip re-validation
+        activity = create_model(
+            CarePlanActivity,
+            False,
+            progress=[create_model(Annotation, validate, text=advice_text)]
         )
         
         # Create the CarePlan resource
-        care_plan = CarePlan(
+        care_plan = create_model(
+            CarePlan,
+            validate,
             id=resource_id,
             status=status,
             intent=intent,
@@ -169,6 +187,8 @@ class AdviceBuilder:
         subject_reference: Optional[Reference] = None,
         encounter_reference: Optional[Reference] = None,
         id: Optional[str] = None,
+        generate_id: bool = True,
+        validate: bool = True,
     ) -> CarePlan:
         """
         Build a CarePlan with multiple advice items.
@@ -181,23 +201,34 @@ class AdviceBuilder:
             subject_reference: Reference to patient
             encounter_reference: Reference to encounter
             id: Resource ID
+            generate_id: Generate a UUID when no id is given; pass False
+                         to leave the id unset (e.g. for server-assigned ids)
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
-            FHIR CarePlan with multiple activities
+            FHIR CarePlan with multiple activities (duplicate advice texts
+            share one Annotation, so treat the notes as read-only)
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or (new_resource_id() if generate_id else None)
         
-        # Build activities for each advice
-        activities = [
-            CarePlanActivity(
-                progress=[Annotation(text=text)]
-            )
-            for text in advice_texts
-        ]
+        # Build activities for each advice; repeated advice texts share one
+        # progress note, and an activity only wraps its already-built note,
+        # so it is cloned without re-validation
+        notes = {}
+        activities = []
+        for text in advice_texts:
+            note = notes.get(text)
+            if note is None:
+                note = notes[text] = create_model(Annotation, validate, text=text)
+            activities.append(create_model(CarePlanActivity, False, progress=[note]))
         
         # Create the CarePlan resource
-        care_plan = CarePlan(
+        care_plan = create_model(
+            CarePlan,
+            validate,
             id=resource_id,
             status=status,
             intent=intent,
@@ -234,6 +265,8 @@ class ClinicalNoteBuilder:
         sender_reference: Optional[Reference] = None,
         sent: Optional[DateTimeInput] = None,
         id: Optional[str] = None,
+        generate_id: bool = True,
+        validate: bool = True,
     ) -> Communication:
         """
         Build a FHIR Communication resource for clinical notes.
@@ -247,6 +280,11 @@ class ClinicalNoteBuilder:
             sender_reference: Reference to sender
             sent: When the note was sent/recorded
             id: Resource ID
+            generate_id: Generate a UUID when no id is given; pass False
+                         to leave the id unset (e.g. for server-assigned ids)
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
             FHIR Communication resource
@@ -258,21 +296,27 @@ class ClinicalNoteBuilder:
             )
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or (new_resource_id() if generate_id else None)
         
         # Build category
         category_list = None
         if category:
-            category_list = [CodeableConcept(text=category)]
+            category_list = [parse_code_input(category)]
         
         # Build payload with the note
         # R5 removed contentString, use contentCodeableConcept for text
         payload = [
-            CommunicationPayload(contentCodeableConcept=CodeableConcept(text=note_text))
+            create_model(
+                CommunicationPayload,
+                validate,
+                contentCodeableConcept=create_model(CodeableConcept, validate, text=note_text)
+            )
         ]
         
         # Create the Communication resource
-        communication = Communication(
+        communication = create_model(
+            Communication,
+            validate,
             id=resource_id,
             status=status,
             category=category_list,
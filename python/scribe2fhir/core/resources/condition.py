@@ -13,7 +13,6 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/condition.html
 """
 
-import uuid
 from typing import Optional, List, Union
 from datetime import datetime, date
 
@@ -30,6 +29,8 @@ from ..enums import (
     ConditionCategory,
     Severity,
     Laterality,
+    code_value,
+    coerce_code,
 )
 from ..types import (
     CodeInput,
@@ -40,6 +41,7 @@ from ..types import (
     create_codeable_concept,
     create_coding,
     create_period,
+    new_resource_id,
 )
 
 
@@ -111,13 +113,13 @@ class ConditionBuilder:
             FHIR Condition resource
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or new_resource_id()
         
         # Parse the condition code
         condition_code = parse_code_input(code)
         
         # Build category
-        category_coding = category.value if isinstance(category, ConditionCategory) else category
+        category_coding = code_value(category)
         category_concept = CodeableConcept(
             coding=[
                 Coding(
@@ -129,7 +131,7 @@ class ConditionBuilder:
         )
         
         # Build clinical status
-        status_value = clinical_status.value if isinstance(clinical_status, ConditionClinicalStatus) else clinical_status
+        status_value = code_value(clinical_status)
         clinical_status_concept = CodeableConcept(
             coding=[
                 Coding(
@@ -143,7 +145,7 @@ class ConditionBuilder:
         # Build verification status (optional)
         verification_status_concept = None
         if verification_status:
-            ver_value = verification_status.value if isinstance(verification_status, ConditionVerificationStatus) else verification_status
+            ver_value = code_value(verification_status)
             verification_status_concept = CodeableConcept(
                 coding=[
                     Coding(
@@ -157,7 +159,7 @@ class ConditionBuilder:
         # Build severity (optional)
         severity_concept = None
         if severity:
-            sev = severity if isinstance(severity, Severity) else Severity(severity.lower())
+            sev = coerce_code(Severity, severity)
             severity_concept = CodeableConcept(
                 coding=[
                     Coding(
@@ -182,7 +184,7 @@ class ConditionBuilder:
             
             # Add laterality as a qualifier
             if laterality:
-                lat = laterality if isinstance(laterality, Laterality) else Laterality(laterality.lower())
+                lat = coerce_code(Laterality, laterality)
                 body_site_codings.append(
                     Coding(
                         system=CodingSystem.SNOMED_CT,
@@ -197,7 +199,7 @@ class ConditionBuilder:
                 if body_site and isinstance(body_site, str):
                     text_parts.append(body_site)
                 if laterality:
-                    lat = laterality if isinstance(laterality, Laterality) else Laterality(laterality.lower())
+                    lat = coerce_code(Laterality, laterality)
                     text_parts.append(lat.display)
                 
                 body_site_list = [
@@ -12,7 +12,7 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/encounter.html
 """
 
-import uuid
+from types import MappingProxyType
 from typing import Optional, List, Union
 from datetime import datetime
 
@@ -22,7 +22,7 @@ from fhir.resources.coding import Coding
 from fhir.resources.period import Period
 from fhir.resources.reference import Reference
 
-from ..types import DateTimeInput, format_datetime, create_period
+from ..types import DateTimeInput, format_datetime, create_period, new_resource_id
 
 
 class EncounterClass:
@@ -53,6 +53,27 @@ class EncounterStatus:
     UNKNOWN = "unknown"
 
 
+# Common encounter class names accepted in place of EncounterClass codes
+_ENCOUNTER_CLASS_NAMES = MappingProxyType({
+    "ambulatory": EncounterClass.AMBULATORY,
+    "amb": EncounterClass.AMBULATORY,
+    "outpatient": EncounterClass.AMBULATORY,
+    "opd": EncounterClass.AMBULATORY,
+    "emergency": EncounterClass.EMERGENCY,
+    "emer": EncounterClass.EMERGENCY,
+    "er": EncounterClass.EMERGENCY,
+    "inpatient": EncounterClass.INPATIENT_ENCOUNTER,
+    "imp": EncounterClass.INPATIENT_ENCOUNTER,
+    "ipd": EncounterClass.INPATIENT_ENCOUNTER,
+    "home": EncounterClass.HOME_HEALTH,
+    "hh": EncounterClass.HOME_HEALTH,
+    "virtual": EncounterClass.VIRTUAL,
+    "vr": EncounterClass.VIRTUAL,
+    "teleconsultation": EncounterClass.VIRTUAL,
+    "observation": EncounterClass.OBSERVATION_ENCOUNTER,
+})
+
+
 class EncounterBuilder:
     """
     Builder for creating FHIR Encounter resources.
@@ -85,29 +106,9 @@ class EncounterBuilder:
         if isinstance(encounter_class, Coding):
             return encounter_class
         
-        # Map string to standard codes
-        class_map = {
-            "ambulatory": EncounterClass.AMBULATORY,
-            "amb": EncounterClass.AMBULATORY,
-            "outpatient": EncounterClass.AMBULATORY,
-            "opd": EncounterClass.AMBULATORY,
-            "emergency": EncounterClass.EMERGENCY,
-            "emer": EncounterClass.EMERGENCY,
-            "er": EncounterClass.EMERGENCY,
-            "inpatient": EncounterClass.INPATIENT_ENCOUNTER,
-            "imp": EncounterClass.INPATIENT_ENCOUNTER,
-            "ipd": EncounterClass.INPATIENT_ENCOUNTER,
-            "home": EncounterClass.HOME_HEALTH,
-            "hh": EncounterClass.HOME_HEALTH,
-            "virtual": EncounterClass.VIRTUAL,
-            "vr": EncounterClass.VIRTUAL,
-            "teleconsultation": EncounterClass.VIRTUAL,
-            "observation": EncounterClass.OBSERVATION_ENCOUNTER,
-        }
-        
         class_lower = encounter_class.lower()
-        if class_lower in class_map:
-            code, display = class_map[class_lower]
+        if class_lower in _ENCOUNTER_CLASS_NAMES:
+            code, display = _ENCOUNTER_CLASS_NAMES[class_lower]
         else:
             # Use as-is if not recognized
             code = encounter_class
@@ -166,7 +167,7 @@ class EncounterBuilder:
             )
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or new_resource_id()
         
         # Parse encounter class
         class_coding = EncounterBuilder._parse_encounter_class(encounter_class)
@@ -10,7 +10,7 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/familymemberhistory.html
 """
 
-import uuid
+from types import MappingProxyType
 from typing import Optional, List, Union
 from datetime import datetime
 
@@ -27,6 +27,7 @@ from ..types import (
     CodingSystem,
     parse_code_input,
     format_datetime,
+    new_resource_id,
 )
 
 
@@ -75,6 +76,26 @@ class FamilyMemberHistoryStatus:
     HEALTH_UNKNOWN = "health-unknown"
 
 
+# Common relationship names accepted in place of FamilyRelationship codes
+_RELATIONSHIP_NAMES = MappingProxyType({
+    "father": FamilyRelationship.FATHER,
+    "mother": FamilyRelationship.MOTHER,
+    "brother": FamilyRelationship.BROTHER,
+    "sister": FamilyRelationship.SISTER,
+    "sibling": FamilyRelationship.SIBLING,
+    "son": FamilyRelationship.SON,
+    "daughter": FamilyRelationship.DAUGHTER,
+    "child": FamilyRelationship.CHILD,
+    "grandfather": FamilyRelationship.GRANDFATHER,
+    "grandmother": FamilyRelationship.GRANDMOTHER,
+    "aunt": FamilyRelationship.AUNT,
+    "uncle": FamilyRelationship.UNCLE,
+    "cousin": FamilyRelationship.COUSIN,
+    "family member": FamilyRelationship.FAMILY_MEMBER,
+    "spouse": FamilyRelationship.SIGNIFICANT_OTHER,
+})
+
+
 class FamilyMemberHistoryBuilder:
     """
     Builder for creating FHIR FamilyMemberHistory resources.
@@ -115,28 +136,9 @@ class FamilyMemberHistoryBuilder:
                 text=display
             )
         
-        # Map common strings to codes
-        relationship_map = {
-            "father": FamilyRelationship.FATHER,
-            "mother": FamilyRelationship.MOTHER,
-            "brother": FamilyRelationship.BROTHER,
-            "sister": FamilyRelationship.SISTER,
-            "sibling": FamilyRelationship.SIBLING,
-            "son": FamilyRelationship.SON,
-            "daughter": FamilyRelationship.DAUGHTER,
-            "child": FamilyRelationship.CHILD,
-            "grandfather": FamilyRelationship.GRANDFATHER,
-            "grandmother": FamilyRelationship.GRANDMOTHER,
-            "aunt": FamilyRelationship.AUNT,
-            "uncle": FamilyRelationship.UNCLE,
-            "cousin": FamilyRelationship.COUSIN,
-            "family member": FamilyRelationship.FAMILY_MEMBER,
-            "spouse": FamilyRelationship.SIGNIFICANT_OTHER,
-        }
-        
         relationship_lower = relationship.lower()
-        if relationship_lower in relationship_map:
-            code, display = relationship_map[relationship_lower]
+        if relationship_lower in _RELATIONSHIP_NAMES:
+            code, display = _RELATIONSHIP_NAMES[relationship_lower]
         else:
             # Use as-is
             code = relationship.upper()
@@ -202,7 +204,7 @@ class FamilyMemberHistoryBuilder:
             )
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or new_resource_id()
         
         # Parse condition
         condition_code = parse_code_input(condition)
@@ -12,33 +12,44 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/immunization.html
 """
 
-import uuid
-from typing import Optional, List, Union
+from typing import Any, Dict, Optional, List, Union
 from datetime import datetime
 
 from fhir.resources.immunization import Immunization, ImmunizationPerformer, ImmunizationProtocolApplied
 from fhir.resources.codeableconcept import CodeableConcept
+from fhir.resources.codeablereference import CodeableReference
 from fhir.resources.coding import Coding
 from fhir.resources.quantity import Quantity
 from fhir.resources.reference import Reference
 from fhir.resources.annotation import Annotation
 
+from ..enums import CodeEnum, _register_code_enums, code_value
 from ..types import (
     CodeInput,
     DateTimeInput,
     CodingSystem,
     parse_code_input,
+    parse_code_input_dict,
+    reference_dict,
+    merge_batch_record,
     format_datetime,
+    create_model,
+    new_resource_id,
 )
 
 
-class ImmunizationStatus:
+class ImmunizationStatus(CodeEnum):
     """Immunization status codes."""
     COMPLETED = "completed"
     ENTERED_IN_ERROR = "entered-in-error"
     NOT_DONE = "not-done"
 
 
+_register_code_enums(
+    ImmunizationStatus,
+)
+
+
 class ImmunizationBuilder:
     """
     Builder for creating FHIR Immunization resources.
@@ -75,6 +86,8 @@ class ImmunizationBuilder:
         performer_reference: Optional[Reference] = None,
         manufacturer_reference: Optional[Reference] = None,
         id: Optional[str] = None,
+        generate_id: bool = True,
+        validate: bool = True,
     ) -> Immunization:
         """
         Build a FHIR Immunization resource.
@@ -99,6 +112,11 @@ class ImmunizationBuilder:
             performer_reference: Reference to who administered
             manufacturer_reference: Reference to manufacturer
             id: Resource ID
+            generate_id: Generate a UUID when no id is given; pass False
+                         to leave the id unset (e.g. for server-assigned ids)
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
             FHIR Immunization resource
@@ -113,7 +131,7 @@ class ImmunizationBuilder:
             )
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or (new_resource_id() if generate_id else None)
         
         # Parse vaccine code
         vaccine_code = parse_code_input(vaccine)
@@ -139,7 +157,9 @@ class ImmunizationBuilder:
         # Build dose quantity
         dose_qty = None
         if dose_quantity is not None:
-            dose_qty = Quantity(
+            dose_qty = create_model(
+                Quantity,
+                validate,
                 value=dose_quantity,
                 unit=dose_unit or "dose"
             )
@@ -152,13 +172,15 @@ class ImmunizationBuilder:
         # Build performer
         performers = None
         if performer_reference:
-            performers = [ImmunizationPerformer(actor=performer_reference)]
+            performers = [create_model(ImmunizationPerformer, validate, actor=performer_reference)]
         
         # Build protocol applied (dose series info)
         protocol_applied = None
         if dose_number is not None or series_doses is not None:
             protocol_applied = [
-                ImmunizationProtocolApplied(
+                create_model(
+                    ImmunizationProtocolApplied,
+                    validate,
                     doseNumberPositiveInt=dose_number,
                     seriesDosesPositiveInt=series_doses
                 )
@@ -167,23 +189,16 @@ class ImmunizationBuilder:
         # Build notes
         note = None
         if notes:
-            note = [Annotation(text=notes)]
-        
-        # Prepare R5 compatible fields
-        from fhir.resources.codeablereference import CodeableReference
+            note = [create_model(Annotation, validate, text=notes)]
         
         # reason is List[CodeableReference] in R5
         reason_val = None
         if reason_code:
-            reason_val = [CodeableReference(concept=rc) for rc in reason_code]
+            reason_val = [create_model(CodeableReference, validate, concept=rc) for rc in reason_code]
 
-        # Create the Immunization resource
         # Create the Immunization resource
         immunization_kwargs = {
             "id": resource_id,
-            "status": status,
-            "vaccineCode": vaccine_code,
-            "patient": subject_reference,
             "encounter": encounter_reference,
             "lotNumber": lot_number,
             "expirationDate": format_datetime(expiration_date) if expiration_date else None,
@@ -205,8 +220,169 @@ class ImmunizationBuilder:
             # occurrence[x] is mandatory in FHIR R5. Default to "Unknown" if not provided.
             immunization_kwargs["occurrenceString"] = "Unknown"
 
-        immunization = Immunization(**immunization_kwargs)
+        # status, vaccineCode and patient are required elements, so they are
+        # always passed (even as None); optional elements only when set
+        immunization_kwargs = {k: v for k, v in immunization_kwargs.items() if v is not None}
+        immunization = create_model(
+            Immunization,
+            validate,
+            status=status,
+            vaccineCode=vaccine_code,
+            patient=subject_reference,
+            **immunization_kwargs
+        )
+        
+        return immunization
+    
+    @staticmethod
+    def build_dict(
+        vaccine: CodeInput,
+        status: str = ImmunizationStatus.COMPLETED,
+        occurrence_date: Optional[DateTimeInput] = None,
+        occurrence_string: Optional[str] = None,
+        lot_number: Optional[str] = None,
+        expiration_date: Optional[DateTimeInput] = None,
+        site: Optional[CodeInput] = None,
+        route: Optional[CodeInput] = None,
+        dose_quantity: Optional[float] = None,
+        dose_unit: Optional[str] = None,
+        dose_number: Optional[int] = None,
+        series_doses: Optional[int] = None,
+        reason: Optional[CodeInput] = None,
+        notes: Optional[str] = None,
+        subject_reference: Optional[Reference] = None,
+        encounter_reference: Optional[Reference] = None,
+        performer_reference: Optional[Reference] = None,
+        manufacturer_reference: Optional[Reference] = None,
+        id: Optional[str] = None,
+        generate_id: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Build an Immunization directly in its FHIR JSON form.
+        
+        Takes the same arguments as build() and returns what
+        build(...).model_dump(mode="json") would, without creating any
+        pydantic models. Nothing is validated, so this is meant for bulk
+        pipelines that serialize trusted data straight away. The
+        manufacturer and dose series are written in their R5 shapes.
+        Date strings are not re-rendered as the model would render them,
+        so use datetime objects or canonical FHIR date strings.
+        
+        Returns:
+            Immunization resource as a JSON-ready dict
+            
+        Example:
+            payload = ImmunizationBuilder.build_dict(
+                vaccine="COVID-19 vaccine",
+                occurrence_date="2021-04-15"
+            )
+        """
+        resource_id = id or (new_resource_id() if generate_id else None)
+        
+        immunization = {"resourceType": "Immunization"}
+        if resource_id:
+            immunization["id"] = resource_id
+        immunization["status"] = code_value(status)
+        immunization["vaccineCode"] = parse_code_input_dict(vaccine)
+        if manufacturer_reference is not None:
+            # manufacturer is a CodeableReference in R5
+            immunization["manufacturer"] = {"reference": reference_dict(manufacturer_reference)}
+        if lot_number is not None:
+            immunization["lotNumber"] = lot_number
+        if expiration_date:
+            immunization["expirationDate"] = format_datetime(expiration_date)
+        if subject_reference is not None:
+            immunization["patient"] = reference_dict(subject_reference)
+        if encounter_reference is not None:
+            immunization["encounter"] = reference_dict(encounter_reference)
+        
+        # occurrence[x] is mandatory in FHIR R5. Default to "Unknown" if not provided.
+        if occurrence_date:
+            immunization["occurrenceDateTime"] = format_datetime(occurrence_date)
+        else:
+            immunization["occurrenceString"] = occurrence_string or "Unknown"
+        
+        if site:
+            immunization["site"] = parse_code_input_dict(site)
+        if route:
+            immunization["route"] = parse_code_input_dict(route)
+        if dose_quantity is not None:
+            immunization["doseQuantity"] = {"value": dose_quantity, "unit": dose_unit or "dose"}
+        if performer_reference:
+            immunization["performer"] = [{"actor": reference_dict(performer_reference)}]
+        if notes:
+            immunization["note"] = [{"text": notes}]
+        if reason:
+            immunization["reason"] = [{"concept": parse_code_input_dict(reason)}]
+        if dose_number is not None or series_doses is not None:
+            # R5 carries dose numbers as strings (doseNumber/seriesDoses)
+            protocol = {}
+            if dose_number is not None:
+                protocol["doseNumber"] = str(dose_number)
+            if series_doses is not None:
+                protocol["seriesDoses"] = str(series_doses)
+            immunization["protocolApplied"] = [protocol]
         
         return immunization
+    
+    @staticmethod
+    def build_batch(
+        records: List[Dict[str, Any]],
+        occurrence_date: Optional[DateTimeInput] = None,
+        subject_reference: Optional[Reference] = None,
+        encounter_reference: Optional[Reference] = None,
+        site: Optional[CodeInput] = None,
+        route: Optional[CodeInput] = None,
+        performer_reference: Optional[Reference] = None,
+        validate: bool = True,
+    ) -> List[Immunization]:
+        """
+        Build several Immunization resources that share common details,
+        e.g. all vaccines given at one visit.
+        
+        The shared site and route are parsed once and the resulting
+        objects are reused by every resource (treat them as read-only).
+        
+        Args:
+            records: One dict of build() keyword arguments per immunization;
+                     keys given here override the shared values below
+            occurrence_date: When the vaccines were given (not applied to
+                             records that set occurrence_string)
+            subject_reference: Reference to patient
+            encounter_reference: Reference to encounter
+            site: Body site where administered
+            route: Route of administration
+            performer_reference: Reference to who administered
+            validate: Run pydantic validation (see build())
+            
+        Returns:
+            List of FHIR Immunization resources, in record order
+            
+        Example:
+            immunizations = ImmunizationBuilder.build_batch(
+                [
+                    {"vaccine": "MMR vaccine", "lot_number": "M123"},
+                    {"vaccine": "Varicella vaccine", "lot_number": "V456"},
+                ],
+                occurrence_date="2024-03-01",
+                route="Subcutaneous"
+            )
+        """
+        common = {
+            "occurrence_date": occurrence_date,
+            "subject_reference": subject_reference,
+            "encounter_reference": encounter_reference,
+            "site": parse_code_input(site) if site else None,
+            "route": parse_code_input(route) if route else None,
+            "performer_reference": performer_reference,
+            "validate": validate,
+        }
+        return [
+            ImmunizationBuilder.build(**merge_batch_record(common, record, _OCCURRENCE_ALTERNATIVES))
+            for record in records
+        ]
 
 
+# A record's own occurrence_string replaces the shared occurrence_date in
+# build_batch()
+_OCCURRENCE_ALTERNATIVES = {"occurrence_date": ("occurrence_string",)}
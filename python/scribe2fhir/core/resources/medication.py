@@ -17,7 +17,6 @@ Reference:
 - https://www.hl7.org/fhir/dosage.html
 """
 
-import uuid
 from typing import Optional, List, Union
 from datetime import datetime, date
 
@@ -39,6 +38,7 @@ from ..enums import (
     MedicationStatementStatus,
     RouteOfAdministration,
     EventTiming,
+    code_value,
 )
 from ..types import (
     CodeInput,
@@ -50,6 +50,7 @@ from ..types import (
     format_datetime,
     create_quantity,
     create_period,
+    new_resource_id,
 )
 
 
@@ -147,7 +148,7 @@ class DosageBuilder:
                 repeat_kwargs["durationUnit"] = duration_unit or "d"
             
             if timing_code:
-                code = timing_code.value if isinstance(timing_code, EventTiming) else timing_code
+                code = code_value(timing_code)
                 repeat_kwargs["when"] = [code]
             
             timing_repeat = TimingRepeat(**repeat_kwargs) if repeat_kwargs else None
@@ -171,8 +172,8 @@ class DosageBuilder:
                     text=route.display
                 )
             elif isinstance(route, str):
-                try:
-                    route_enum = RouteOfAdministration(route.lower())
+                route_enum = RouteOfAdministration.LOOKUP.get(route.lower())
+                if route_enum is not None:
                     route_concept = CodeableConcept(
                         coding=[
                             Coding(
@@ -183,7 +184,7 @@ class DosageBuilder:
                         ],
                         text=route_enum.display
                     )
-                except ValueError:
+                else:
                     # If not a known route, just use text
                     route_concept = CodeableConcept(text=route)
         
@@ -291,16 +292,16 @@ class MedicationBuilder:
             FHIR MedicationRequest resource
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or new_resource_id()
         
         # Parse medication code
         medication_code = parse_code_input(medication)
         
         # Handle status enum
-        status_value = status.value if isinstance(status, MedicationRequestStatus) else status
+        status_value = code_value(status)
         
         # Handle intent enum
-        intent_value = intent.value if isinstance(intent, MedicationRequestIntent) else intent
+        intent_value = code_value(intent)
         
         # Build dosage instructions
         dosage_instruction = None
@@ -407,13 +408,13 @@ class MedicationBuilder:
             FHIR MedicationStatement resource
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or new_resource_id()
         
         # Parse medication code
         medication_code = parse_code_input(medication)
         
         # Handle status enum
-        status_value = status.value if isinstance(status, MedicationStatementStatus) else status
+        status_value = code_value(status)
         
         # Build dosage
         dosage_list = None
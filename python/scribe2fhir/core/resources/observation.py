@@ -13,8 +13,9 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/observation.html
 """
 
-import uuid
-from typing import Optional, List, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Optional, List, Tuple, Union
 from datetime import datetime
 
 from fhir.resources.observation import Observation, ObservationComponent
@@ -24,16 +25,22 @@ from fhir.resources.quantity import Quantity
 from fhir.resources.reference import Reference
 from fhir.resources.annotation import Annotation
 
-from ..enums import ObservationStatus, Interpretation
+from ..enums import ObservationStatus, Interpretation, code_value
 from ..types import (
     CodeInput,
     DateTimeInput,
     QuantityInput,
     CodingSystem,
     parse_code_input,
+    parse_code_input_dict,
     parse_quantity_input,
+    reference_dict,
+    shared_reference_dict,
+    merge_batch_record,
     format_datetime,
     create_quantity,
+    create_model,
+    new_resource_id,
 )
 
 
@@ -64,6 +71,19 @@ class VitalSignCodes:
     HEAD_CIRCUMFERENCE = ("9843-4", "Head circumference")
 
 
+# Common interpretation names accepted in place of Interpretation members
+_INTERPRETATION_NAMES = MappingProxyType({
+    "normal": Interpretation.NORMAL,
+    "abnormal": Interpretation.ABNORMAL,
+    "low": Interpretation.LOW,
+    "high": Interpretation.HIGH,
+    "critical low": Interpretation.CRITICAL_LOW,
+    "critical high": Interpretation.CRITICAL_HIGH,
+    "positive": Interpretation.POSITIVE,
+    "negative": Interpretation.NEGATIVE,
+})
+
+
 class ObservationBuilder:
     """
     Builder for creating FHIR Observation resources.
@@ -97,56 +117,15 @@ class ObservationBuilder:
     
     @staticmethod
     def _create_category(category: tuple) -> CodeableConcept:
-        """Create a category CodeableConcept."""
-        code, display = category
-        return CodeableConcept(
-            coding=[
-                Coding(
-                    system=ObservationBuilder.OBSERVATION_CATEGORY_SYSTEM,
-                    code=code,
-                    display=display
-                )
-            ]
-        )
+        """Create a category CodeableConcept (shared, treat as read-only)."""
+        return _category_concept(category)
     
     @staticmethod
     def _create_interpretation(
         interpretation: Union[Interpretation, str]
     ) -> CodeableConcept:
-        """Create an interpretation CodeableConcept."""
-        if isinstance(interpretation, Interpretation):
-            code = interpretation.value
-            display = interpretation.display
-        else:
-            # Map common strings
-            interp_map = {
-                "normal": Interpretation.NORMAL,
-                "abnormal": Interpretation.ABNORMAL,
-                "low": Interpretation.LOW,
-                "high": Interpretation.HIGH,
-                "critical low": Interpretation.CRITICAL_LOW,
-                "critical high": Interpretation.CRITICAL_HIGH,
-                "positive": Interpretation.POSITIVE,
-                "negative": Interpretation.NEGATIVE,
-            }
-            if interpretation.lower() in interp_map:
-                interp = interp_map[interpretation.lower()]
-                code = interp.value
-                display = interp.display
-            else:
-                code = interpretation
-                display = interpretation
-        
-        return CodeableConcept(
-            coding=[
-                Coding(
-                    system=ObservationBuilder.INTERPRETATION_SYSTEM,
-                    code=code,
-                    display=display
-                )
-            ],
-            text=display
-        )
+        """Create an interpretation CodeableConcept (shared, treat as read-only)."""
+        return _interpretation_concept(*_interpretation_code(interpretation))
     
     @staticmethod
     def _build_observation(
@@ -163,18 +142,19 @@ class ObservationBuilder:
         encounter_reference: Optional[Reference] = None,
         performer_references: Optional[List[Reference]] = None,
         id: Optional[str] = None,
+        validate: bool = True,
     ) -> Observation:
         """
         Internal method to build an Observation resource.
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or new_resource_id()
         
         # Parse code
         observation_code = parse_code_input(code)
         
         # Handle status
-        obs_status = status.value if isinstance(status, ObservationStatus) else status
+        obs_status = code_value(status)
         
         # Build category
         category_concept = ObservationBuilder._create_category(category)
@@ -205,10 +185,12 @@ class ObservationBuilder:
         # Build notes
         note = None
         if notes:
-            note = [Annotation(text=notes)]
+            note = [create_model(Annotation, validate, text=notes)]
         
         # Create the Observation resource
-        observation = Observation(
+        observation = create_model(
+            Observation,
+            validate,
             id=resource_id,
             status=obs_status,
             category=[category_concept],
@@ -241,6 +223,7 @@ class ObservationBuilder:
         subject_reference: Optional[Reference] = None,
         encounter_reference: Optional[Reference] = None,
         id: Optional[str] = None,
+        validate: bool = True,
     ) -> Observation:
         """
         Build a vital signs Observation.
@@ -257,6 +240,9 @@ class ObservationBuilder:
             subject_reference: Reference to patient
             encounter_reference: Reference to encounter
             id: Resource ID
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
             FHIR Observation with vital-signs category
@@ -300,6 +286,7 @@ class ObservationBuilder:
             subject_reference=subject_reference,
             encounter_reference=encounter_reference,
             id=id,
+            validate=validate,
         )
     
     @staticmethod
@@ -315,6 +302,7 @@ class ObservationBuilder:
         encounter_reference: Optional[Reference] = None,
         performer_references: Optional[List[Reference]] = None,
         id: Optional[str] = None,
+        validate: bool = True,
     ) -> Observation:
         """
         Build a laboratory Observation.
@@ -331,6 +319,9 @@ class ObservationBuilder:
             encounter_reference: Reference to encounter
             performer_references: References to lab/technician
             id: Resource ID
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
             FHIR Observation with laboratory category
@@ -357,8 +348,389 @@ class ObservationBuilder:
             encounter_reference=encounter_reference,
             performer_references=performer_references,
             id=id,
+            validate=validate,
+        )
+    
+    @staticmethod
+    def build_vitals_bulk(
+        codes: List[CodeInput],
+        values: Optional[List[Optional[Union[str, float, Quantity]]]] = None,
+        units: Optional[List[Optional[str]]] = None,
+        dates: Optional[List[Optional[DateTimeInput]]] = None,
+        interpretations: Optional[List[Optional[Union[Interpretation, str]]]] = None,
+        status: Union[ObservationStatus, str] = ObservationStatus.FINAL,
+        subject_reference: Optional[Reference] = None,
+        encounter_reference: Optional[Reference] = None,
+        validate: bool = True,
+    ) -> List[Observation]:
+        """
+        Build many vital signs Observations from column-style lists.
+        
+        Args:
+            codes: Vital sign type per observation
+            values: Measured value per observation
+            units: Unit per observation
+            dates: Measurement time per observation
+            interpretations: Interpretation per observation
+            status: Observation status shared by all observations
+            subject_reference: Reference to patient
+            encounter_reference: Reference to encounter
+            validate: Run pydantic validation (see build_vital())
+            
+        Returns:
+            List of FHIR Observations with vital-signs category, in input order
+            
+        Example:
+            vitals = ObservationBuilder.build_vitals_bulk(
+                codes=["Heart Rate", "Body Temperature"],
+                values=[72, 98.6],
+                units=["bpm", "degF"]
+            )
+        """
+        return ObservationBuilder._build_bulk(
+            ObservationCategory.VITAL_SIGNS,
+            codes, values, units, dates, interpretations,
+            status, subject_reference, encounter_reference, validate,
+        )
+    
+    @staticmethod
+    def build_labs_bulk(
+        codes: List[CodeInput],
+        values: Optional[List[Optional[Union[str, float, Quantity]]]] = None,
+        units: Optional[List[Optional[str]]] = None,
+        dates: Optional[List[Optional[DateTimeInput]]] = None,
+        interpretations: Optional[List[Optional[Union[Interpretation, str]]]] = None,
+        status: Union[ObservationStatus, str] = ObservationStatus.FINAL,
+        subject_reference: Optional[Reference] = None,
+        encounter_reference: Optional[Reference] = None,
+        validate: bool = True,
+    ) -> List[Observation]:
+        """
+        Build many laboratory Observations from column-style lists.
+        
+        Args:
+            codes: Lab test per observation
+            values: Result value per observation
+            units: Unit per observation
+            dates: Test time per observation
+            interpretations: Result interpretation per observation
+            status: Observation status shared by all observations
+            subject_reference: Reference to patient
+            encounter_reference: Reference to encounter
+            validate: Run pydantic validation (see build_vital())
+            
+        Returns:
+            List of FHIR Observations with laboratory category, in input order
+            
+        Example:
+            labs = ObservationBuilder.build_labs_bulk(
+                codes=["Hemoglobin", "Fasting blood sugar"],
+                values=[12.5, 92],
+                units=["g/dL", "mg/dL"],
+                interpretations=[Interpretation.NORMAL, Interpretation.NORMAL]
+            )
+        """
+        return ObservationBuilder._build_bulk(
+            ObservationCategory.LABORATORY,
+            codes, values, units, dates, interpretations,
+            status, subject_reference, encounter_reference, validate,
+        )
+    
+    @staticmethod
+    def _build_bulk(
+        category: tuple,
+        codes: List[CodeInput],
+        values: Optional[List],
+        units: Optional[List],
+        dates: Optional[List],
+        interpretations: Optional[List],
+        status: Union[ObservationStatus, str],
+        subject_reference: Optional[Reference],
+        encounter_reference: Optional[Reference],
+        validate: bool,
+    ) -> List[Observation]:
+        """
+        Internal method to build one Observation per row of the given columns.
+        """
+        count = len(codes)
+        columns = []
+        for column in (values, units, dates, interpretations):
+            if column is None:
+                column = [None] * count
+            elif len(column) != count:
+                raise ValueError("Each column must have one entry per code")
+            columns.append(column)
+        
+        build = ObservationBuilder._build_observation
+        return [
+            build(
+                code=code,
+                category=category,
+                value=value,
+                unit=unit,
+                date=date,
+                status=status,
+                interpretation=interpretation,
+                subject_reference=subject_reference,
+                encounter_reference=encounter_reference,
+                validate=validate,
+            )
+            for code, value, unit, date, interpretation in zip(codes, *columns)
+        ]
+    
+    @staticmethod
+    def build_vital_dict(
+        code: CodeInput,
+        value: Optional[Union[str, float, Quantity]] = None,
+        unit: Optional[str] = None,
+        date: Optional[DateTimeInput] = None,
+        status: Union[ObservationStatus, str] = ObservationStatus.FINAL,
+        interpretation: Optional[Union[Interpretation, str]] = None,
+        notes: Optional[str] = None,
+        components: Optional[List[ObservationComponent]] = None,
+        subject_reference: Optional[Reference] = None,
+        encounter_reference: Optional[Reference] = None,
+        id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build a vital signs Observation directly in its FHIR JSON form.
+        
+        Takes the same arguments as build_vital() and returns what
+        build_vital(...).model_dump(mode="json") would, without creating
+        the Observation model. Nothing is validated, so this is meant for
+        bulk pipelines that serialize trusted data straight away. The
+        category and interpretation entries are shared between results,
+        treat them as read-only. Date strings are copied as given, while
+        the model re-renders them (e.g. "+00:00" as "Z"), so pass
+        canonical FHIR strings or datetime objects.
+        
+        Returns:
+            Observation resource as a JSON-ready dict
+            
+        Example:
+            payload = ObservationBuilder.build_vital_dict(
+                code="Heart Rate",
+                value=72,
+                unit="bpm"
+            )
+        """
+        return ObservationBuilder._build_observation_dict(
+            code=code,
+            category=ObservationCategory.VITAL_SIGNS,
+            value=value,
+            unit=unit,
+            date=date,
+            status=status,
+            interpretation=interpretation,
+            notes=notes,
+            components=components,
+            subject_reference=subject_reference,
+            encounter_reference=encounter_reference,
+            id=id,
+        )
+    
+    @staticmethod
+    def build_lab_dict(
+        code: CodeInput,
+        value: Optional[Union[str, float, Quantity]] = None,
+        unit: Optional[str] = None,
+        date: Optional[DateTimeInput] = None,
+        status: Union[ObservationStatus, str] = ObservationStatus.FINAL,
+        interpretation: Optional[Union[Interpretation, str]] = None,
+        notes: Optional[str] = None,
+        subject_reference: Optional[Reference] = None,
+        encounter_reference: Optional[Reference] = None,
+        performer_references: Optional[List[Reference]] = None,
+        id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build a laboratory Observation directly in its FHIR JSON form.
+        
+        Takes the same arguments as build_lab() and returns what
+        build_lab(...).model_dump(mode="json") would (see build_vital_dict()).
+        
+        Returns:
+            Observation resource as a JSON-ready dict
+            
+        Example:
+            payload = ObservationBuilder.build_lab_dict(
+                code="Hemoglobin",
+                value=12.5,
+                unit="g/dL",
+                interpretation=Interpretation.NORMAL
+            )
+        """
+        return ObservationBuilder._build_observation_dict(
+            code=code,
+            category=ObservationCategory.LABORATORY,
+            value=value,
+            unit=unit,
+            date=date,
+            status=status,
+            interpretation=interpretation,
+            notes=notes,
+            subject_reference=subject_reference,
+            encounter_reference=encounter_reference,
+            performer_references=performer_references,
+            id=id,
         )
     
+    @staticmethod
+    def _build_observation_dict(
+        code: CodeInput,
+        category: tuple,
+        value: Optional[Union[str, float, bool, Quantity, CodeableConcept]] = None,
+        unit: Optional[str] = None,
+        date: Optional[DateTimeInput] = None,
+        status: Union[ObservationStatus, str] = ObservationStatus.FINAL,
+        interpretation: Optional[Union[Interpretation, str]] = None,
+        notes: Optional[str] = None,
+        components: Optional[List[ObservationComponent]] = None,
+        subject_reference: Optional[Union[Reference, Dict[str, Any]]] = None,
+        encounter_reference: Optional[Union[Reference, Dict[str, Any]]] = None,
+        performer_references: Optional[List[Union[Reference, Dict[str, Any]]]] = None,
+        id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Internal method to build an Observation as a JSON-ready dict,
+        mirroring _build_observation() in FHIR element order. References
+        may be given already in JSON form. The category and interpretation
+        dicts are shared, treat them as read-only.
+        """
+        observation = {
+            "resourceType": "Observation",
+            "id": id or new_resource_id(),
+            "status": code_value(status),
+            "category": [_category_dict(category)],
+            "code": parse_code_input_dict(code),
+        }
+        if subject_reference is not None:
+            observation["subject"] = reference_dict(subject_reference)
+        if encounter_reference is not None:
+            observation["encounter"] = reference_dict(encounter_reference)
+        if date:
+            observation["effectiveDateTime"] = format_datetime(date)
+        if performer_references:
+            observation["performer"] = [reference_dict(ref) for ref in performer_references]
+        
+        if value is not None:
+            if isinstance(value, Quantity):
+                observation["valueQuantity"] = value.model_dump(mode="json", exclude_none=True)
+            elif isinstance(value, CodeableConcept):
+                observation["valueCodeableConcept"] = value.model_dump(mode="json", exclude_none=True)
+            elif isinstance(value, bool):
+                observation["valueBoolean"] = value
+            elif isinstance(value, (int, float)) and unit:
+                observation["valueQuantity"] = {
+                    "value": float(value),
+                    "unit": unit,
+                    "system": CodingSystem.UCUM,
+                    "code": unit,
+                }
+            else:
+                observation["valueString"] = str(value)
+        
+        if interpretation:
+            observation["interpretation"] = [
+                _interpretation_dict(*_interpretation_code(interpretation))
+            ]
+        if notes:
+            observation["note"] = [{"text": notes}]
+        if components:
+            observation["component"] = [
+                component.model_dump(mode="json", exclude_none=True)
+                for component in components
+            ]
+        
+        return observation
+    
+    @staticmethod
+    def build_batch(
+        records: List[Dict[str, Any]],
+        category: tuple = ObservationCategory.LABORATORY,
+        date: Optional[DateTimeInput] = None,
+        subject_reference: Optional[Union[Reference, Dict[str, Any]]] = None,
+        encounter_reference: Optional[Union[Reference, Dict[str, Any]]] = None,
+        performer_references: Optional[List[Union[Reference, Dict[str, Any]]]] = None,
+        validate: bool = True,
+    ) -> List[Observation]:
+        """
+        Build several Observations that share common details, e.g. all
+        results of one lab panel.
+        
+        The shared references are validated once (dicts are accepted and
+        converted) and the resulting objects are reused by every resource
+        (treat them as read-only).
+        
+        Args:
+            records: One dict of build_lab()-style keyword arguments per
+                     observation (code, value, unit, interpretation, ...);
+                     keys given here override the shared values below
+            category: Observation category (e.g. ObservationCategory.VITAL_SIGNS)
+            date: When the observations were made
+            subject_reference: Reference to patient
+            encounter_reference: Reference to encounter
+            performer_references: References to performers
+            validate: Run pydantic validation (see build_vital())
+            
+        Returns:
+            List of FHIR Observations, in record order
+            
+        Example:
+            panel = ObservationBuilder.build_batch(
+                [
+                    {"code": "Hemoglobin", "value": 12.5, "unit": "g/dL"},
+                    {"code": "WBC", "value": 7.2, "unit": "10^3/uL"},
+                ],
+                date="2024-03-01",
+                subject_reference={"reference": "Patient/123"}
+            )
+        """
+        common = {
+            "category": category,
+            "date": date,
+            "subject_reference": _as_reference(subject_reference),
+            "encounter_reference": _as_reference(encounter_reference),
+            "performer_references": [
+                _as_reference(ref) for ref in performer_references
+            ] if performer_references else None,
+            "validate": validate,
+        }
+        build = ObservationBuilder._build_observation
+        return [build(**merge_batch_record(common, record)) for record in records]
+    
+    @staticmethod
+    def build_batch_dict(
+        records: List[Dict[str, Any]],
+        category: tuple = ObservationCategory.LABORATORY,
+        date: Optional[DateTimeInput] = None,
+        subject_reference: Optional[Union[Reference, Dict[str, Any]]] = None,
+        encounter_reference: Optional[Union[Reference, Dict[str, Any]]] = None,
+        performer_references: Optional[List[Union[Reference, Dict[str, Any]]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build several Observations directly in their FHIR JSON form.
+        
+        Takes the same arguments as build_batch() (without validate) and
+        returns the model_dump(mode="json") form of each result. The shared
+        references are validated and serialized once, and the same dicts
+        are placed in every result (treat them as read-only).
+        
+        Returns:
+            List of Observation resources as JSON-ready dicts, in record order
+        """
+        common = {
+            "category": category,
+            "date": date,
+            "subject_reference": shared_reference_dict(subject_reference),
+            "encounter_reference": shared_reference_dict(encounter_reference),
+            "performer_references": [
+                shared_reference_dict(ref) for ref in performer_references
+            ] if performer_references else None,
+        }
+        build = ObservationBuilder._build_observation_dict
+        return [build(**merge_batch_record(common, record)) for record in records]
+    
     @staticmethod
     def build_exam(
         code: CodeInput,
@@ -370,6 +742,7 @@ class ObservationBuilder:
         encounter_reference: Optional[Reference] = None,
         performer_references: Optional[List[Reference]] = None,
         id: Optional[str] = None,
+        validate: bool = True,
     ) -> Observation:
         """
         Build an examination finding Observation.
@@ -384,6 +757,9 @@ class ObservationBuilder:
             encounter_reference: Reference to encounter
             performer_references: References to examiner
             id: Resource ID
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
             FHIR Observation with exam category
@@ -406,6 +782,7 @@ class ObservationBuilder:
             encounter_reference=encounter_reference,
             performer_references=performer_references,
             id=id,
+            validate=validate,
         )
     
     @staticmethod
@@ -419,6 +796,7 @@ class ObservationBuilder:
         subject_reference: Optional[Reference] = None,
         encounter_reference: Optional[Reference] = None,
         id: Optional[str] = None,
+        validate: bool = True,
     ) -> Observation:
         """
         Build a social history Observation (lifestyle factors).
@@ -435,6 +813,9 @@ class ObservationBuilder:
             subject_reference: Reference to patient
             encounter_reference: Reference to encounter
             id: Resource ID
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
             FHIR Observation with social-history category
@@ -463,6 +844,66 @@ class ObservationBuilder:
             subject_reference=subject_reference,
             encounter_reference=encounter_reference,
             id=id,
+            validate=validate,
         )
 
 
+def _as_reference(reference: Optional[Union[Reference, Dict[str, Any]]]) -> Optional[Reference]:
+    """Validate a reference given as a dict; Reference objects pass through."""
+    if isinstance(reference, dict):
+        return Reference(**reference)
+    return reference
+
+
+def _interpretation_code(interpretation: Union[Interpretation, str]) -> Tuple[str, str]:
+    """Resolve an interpretation input to its (code, display) pair."""
+    if not isinstance(interpretation, Interpretation):
+        # Map common strings; anything else is used as free text
+        interpretation = _INTERPRETATION_NAMES.get(interpretation.lower(), interpretation)
+    
+    if isinstance(interpretation, Interpretation):
+        return interpretation.value, interpretation.display
+    return interpretation, interpretation
+
+
+# Bounded: categories are caller-supplied tuples, not only the built-in ones
+@lru_cache(maxsize=256)
+def _category_concept(category: tuple) -> CodeableConcept:
+    """Build the category CodeableConcept once per (code, display) category."""
+    code, display = category
+    return CodeableConcept(
+        coding=[
+            Coding(
+                system=ObservationBuilder.OBSERVATION_CATEGORY_SYSTEM,
+                code=code,
+                display=display
+            )
+        ]
+    )
+
+
+@lru_cache(maxsize=1024)
+def _interpretation_concept(code: str, display: str) -> CodeableConcept:
+    """Build the interpretation CodeableConcept once per code/display pair."""
+    return CodeableConcept(
+        coding=[
+            Coding(
+                system=ObservationBuilder.INTERPRETATION_SYSTEM,
+                code=code,
+                display=display
+            )
+        ],
+        text=display
+    )
+
+
+@lru_cache(maxsize=256)
+def _category_dict(category: tuple) -> Dict[str, Any]:
+    """JSON form of the category CodeableConcept, built once per category."""
+    return _category_concept(category).model_dump(mode="json", exclude_none=True)
+
+
+@lru_cache(maxsize=1024)
+def _interpretation_dict(code: str, display: str) -> Dict[str, Any]:
+    """JSON form of the interpretation CodeableConcept, built once per code/display pair."""
+    return _interpretation_concept(code, display).model_dump(mode="json", exclude_none=True)
@@ -12,7 +12,8 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/patient.html
 """
 
-import uuid
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, List, Union, Tuple
 from datetime import datetime, date, timedelta
 
@@ -24,7 +25,7 @@ from fhir.resources.contactpoint import ContactPoint
 from fhir.resources.codeableconcept import CodeableConcept
 from fhir.resources.coding import Coding
 
-from ..types import DateTimeInput, format_date
+from ..types import DateTimeInput, format_date, create_model, new_resource_id
 
 
 class IdentifierType:
@@ -46,6 +47,50 @@ class Gender:
     UNKNOWN = "unknown"
 
 
+def _years_before(today: date, years: int) -> date:
+    """Date the given number of years before today."""
+    return today.replace(year=today.year - years)
+
+
+def _months_before(today: date, months: int) -> date:
+    """Approximate date the given number of months before today."""
+    return today - timedelta(days=months * 30)
+
+
+def _days_before(today: date, days: int) -> date:
+    """Date the given number of days before today."""
+    return today - timedelta(days=days)
+
+
+# Common identifier type names accepted in place of IdentifierType values
+_IDENTIFIER_TYPES = MappingProxyType({
+    "abha": IdentifierType.ABHA,
+    "mrn": IdentifierType.MRN,
+    "mobile": IdentifierType.MOBILE,
+    "phone": IdentifierType.MOBILE,
+    "national_id": IdentifierType.NATIONAL_ID,
+    "passport": IdentifierType.PASSPORT,
+    "drivers_license": IdentifierType.DRIVERS_LICENSE,
+    "ssn": IdentifierType.SOCIAL_SECURITY,
+})
+
+_DEFAULT_IDENTIFIER_TYPE_SYSTEM = "http://terminology.hl7.org/CodeSystem/v2-0203"
+
+
+# Accepted age unit spellings -> birth date calculation
+_AGE_UNIT_HANDLERS = MappingProxyType({
+    "year": _years_before,
+    "years": _years_before,
+    "y": _years_before,
+    "month": _months_before,
+    "months": _months_before,
+    "mo": _months_before,
+    "day": _days_before,
+    "days": _days_before,
+    "d": _days_before,
+})
+
+
 class PatientBuilder:
     """
     Builder for creating FHIR Patient resources.
@@ -64,30 +109,26 @@ class PatientBuilder:
     """
     
     @staticmethod
-    def _parse_name(name: Union[str, dict, HumanName]) -> HumanName:
-        """Parse various name formats into a HumanName."""
+    def _parse_name(name: Union[str, dict, HumanName], validate: bool = True) -> HumanName:
+        """Parse various name formats into a HumanName (string names are shared, treat as read-only)."""
         if isinstance(name, HumanName):
             return name
         
         if isinstance(name, dict):
-            return HumanName(
+            given = name.get("given")
+            return create_model(
+                HumanName,
+                validate,
                 text=name.get("text"),
                 family=name.get("family"),
-                given=name.get("given") if isinstance(name.get("given"), list) else [name.get("given")] if name.get("given") else None,
+                given=given if isinstance(given, list) else [given] if given else None,
                 prefix=name.get("prefix"),
                 suffix=name.get("suffix")
             )
         
         # Simple string - try to parse into given/family
         if isinstance(name, str):
-            parts = name.strip().split()
-            if len(parts) == 1:
-                return HumanName(text=name, given=[name])
-            elif len(parts) == 2:
-                return HumanName(text=name, given=[parts[0]], family=parts[1])
-            else:
-                # First parts are given names, last is family
-                return HumanName(text=name, given=parts[:-1], family=parts[-1])
+            return _string_name(name)
         
         raise ValueError(f"Invalid name format: {name}")
     
@@ -100,73 +141,50 @@ class PatientBuilder:
         else:
             age_value, age_unit = age
         
-        today = date.today()
-        
-        if age_unit.lower() in ("year", "years", "y"):
-            birth_date = today.replace(year=today.year - age_value)
-        elif age_unit.lower() in ("month", "months", "mo"):
-            # Approximate calculation
-            days = age_value * 30
-            birth_date = today - timedelta(days=days)
-        elif age_unit.lower() in ("day", "days", "d"):
-            birth_date = today - timedelta(days=age_value)
-        else:
+        subtract_age = _AGE_UNIT_HANDLERS.get(age_unit.lower())
+        if subtract_age is None:
             raise ValueError(f"Unknown age unit: {age_unit}")
         
-        return birth_date.isoformat()
+        return subtract_age(date.today(), age_value).isoformat()
     
     @staticmethod
     def _create_identifier(
         value: str,
         id_type: Union[str, Tuple[str, str]],
-        system: Optional[str] = None
+        system: Optional[str] = None,
+        validate: bool = True,
     ) -> Identifier:
-        """Create an identifier with type coding."""
+        """Create an identifier with type coding (the type concept is shared, treat as read-only)."""
         # Determine type code and system
         if isinstance(id_type, tuple):
             type_code, type_system = id_type
         else:
             # Map common type names to codes
-            type_map = {
-                "abha": IdentifierType.ABHA,
-                "mrn": IdentifierType.MRN,
-                "mobile": IdentifierType.MOBILE,
-                "phone": IdentifierType.MOBILE,
-                "national_id": IdentifierType.NATIONAL_ID,
-                "passport": IdentifierType.PASSPORT,
-                "drivers_license": IdentifierType.DRIVERS_LICENSE,
-                "ssn": IdentifierType.SOCIAL_SECURITY,
-            }
-            if id_type.lower() in type_map:
-                type_code, type_system = type_map[id_type.lower()]
-            else:
-                type_code = id_type
-                type_system = "http://terminology.hl7.org/CodeSystem/v2-0203"
+            type_code, type_system = _IDENTIFIER_TYPES.get(
+                id_type.lower(), (id_type, _DEFAULT_IDENTIFIER_TYPE_SYSTEM)
+            )
         
-        return Identifier(
+        return create_model(
+            Identifier,
+            validate,
             value=value,
-            type=CodeableConcept(
-                coding=[
-                    Coding(
-                        system=type_system,
-                        code=type_code,
-                        display=type_code
-                    )
-                ]
-            ),
+            type=_identifier_type_concept(type_code, type_system),
             system=system
         )
     
     @staticmethod
-    def _parse_address(address: Union[str, dict, Address]) -> Address:
+    def _parse_address(address: Union[str, dict, Address], validate: bool = True) -> Address:
         """Parse various address formats into an Address."""
         if isinstance(address, Address):
             return address
         
         if isinstance(address, dict):
-            return Address(
+            line = address.get("line")
+            return create_model(
+                Address,
+                validate,
                 text=address.get("text"),
-                line=address.get("line") if isinstance(address.get("line"), list) else [address.get("line")] if address.get("line") else None,
+                line=line if isinstance(line, list) else [line] if line else None,
                 city=address.get("city"),
                 state=address.get("state"),
                 postalCode=address.get("postalCode") or address.get("postal_code"),
@@ -176,7 +194,7 @@ class PatientBuilder:
         
         # Simple string - use as text and first line
         if isinstance(address, str):
-            return Address(text=address, line=[address])
+            return create_model(Address, validate, text=address, line=[address])
         
         raise ValueError(f"Invalid address format: {address}")
     
@@ -191,6 +209,7 @@ class PatientBuilder:
         phone: Optional[str] = None,
         email: Optional[str] = None,
         id: Optional[str] = None,
+        validate: bool = True,
     ) -> Patient:
         """
         Build a FHIR Patient resource.
@@ -211,6 +230,9 @@ class PatientBuilder:
             phone: Phone number
             email: Email address
             id: Resource ID
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
             FHIR Patient resource
@@ -229,10 +251,10 @@ class PatientBuilder:
             )
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or new_resource_id()
         
         # Parse name
-        human_name = PatientBuilder._parse_name(name)
+        human_name = PatientBuilder._parse_name(name, validate)
         
         # Calculate birth date from age if provided
         calculated_birth_date = None
@@ -245,24 +267,26 @@ class PatientBuilder:
         parsed_identifiers = None
         if identifiers:
             parsed_identifiers = [
-                PatientBuilder._create_identifier(value, id_type)
+                PatientBuilder._create_identifier(value, id_type, validate=validate)
                 for value, id_type in identifiers
             ]
         
         # Parse address
         parsed_address = None
         if address:
-            parsed_address = [PatientBuilder._parse_address(address)]
+            parsed_address = [PatientBuilder._parse_address(address, validate)]
         
         # Build telecom
         telecom = []
         if phone:
-            telecom.append(ContactPoint(system="phone", value=phone, use="mobile"))
+            telecom.append(create_model(ContactPoint, validate, system="phone", value=phone, use="mobile"))
         if email:
-            telecom.append(ContactPoint(system="email", value=email))
+            telecom.append(create_model(ContactPoint, validate, system="email", value=email))
         
         # Create the Patient resource
-        patient = Patient(
+        patient = create_model(
+            Patient,
+            validate,
             id=resource_id,
             name=[human_name],
             gender=gender,
@@ -275,3 +299,29 @@ class PatientBuilder:
         return patient
 
 
+@lru_cache(maxsize=256)
+def _identifier_type_concept(type_code: str, type_system: str) -> CodeableConcept:
+    """Build the identifier type CodeableConcept once per code/system pair."""
+    return CodeableConcept(
+        coding=[
+            Coding(
+                system=type_system,
+                code=type_code,
+                display=type_code
+            )
+        ]
+    )
+
+
+def _string_name(name: str) -> HumanName:
+    """Parse a plain name string into a new HumanName."""
+    # Not cached: a shared HumanName would be mutable across patients, and
+    # the cache would keep patient names in memory for the process lifetime
+    parts = name.split()
+    if len(parts) == 1:
+        return HumanName(text=name, given=[name])
+    elif len(parts) == 2:
+        return HumanName(text=name, given=[parts[0]], family=parts[1])
+    else:
+        # First parts are given names, last is family
+        return HumanName(text=name, given=parts[:-1], family=parts[-1])
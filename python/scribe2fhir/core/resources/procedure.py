@@ -11,27 +11,34 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/procedure.html
 """
 
-import uuid
-from typing import Optional, List, Union
+from typing import Any, Dict, Optional, List, Union
 from datetime import datetime
 
 from fhir.resources.procedure import Procedure, ProcedurePerformer
 from fhir.resources.codeableconcept import CodeableConcept
+from fhir.resources.codeablereference import CodeableReference
 from fhir.resources.coding import Coding
 from fhir.resources.reference import Reference
 from fhir.resources.annotation import Annotation
 
+from ..enums import CodeEnum, _register_code_enums, code_value
 from ..types import (
     CodeInput,
     DateTimeInput,
     CodingSystem,
     parse_code_input,
+    parse_code_input_dict,
+    reference_dict,
+    merge_batch_record,
+    shared_reference_dict,
     format_datetime,
     create_period,
+    create_model,
+    new_resource_id,
 )
 
 
-class ProcedureStatus:
+class ProcedureStatus(CodeEnum):
     """FHIR Procedure status codes."""
     PREPARATION = "preparation"
     IN_PROGRESS = "in-progress"
@@ -43,6 +50,9 @@ class ProcedureStatus:
     UNKNOWN = "unknown"
 
 
+_register_code_enums(ProcedureStatus)
+
+
 class ProcedureBuilder:
     """
     Builder for creating FHIR Procedure resources.
@@ -75,6 +85,8 @@ class ProcedureBuilder:
         performer_references: Optional[List[Reference]] = None,
         location_reference: Optional[Reference] = None,
         id: Optional[str] = None,
+        generate_id: bool = True,
+        validate: bool = True,
     ) -> Procedure:
         """
         Build a FHIR Procedure resource.
@@ -94,6 +106,11 @@ class ProcedureBuilder:
             performer_references: References to performers
             location_reference: Reference to location
             id: Resource ID
+            generate_id: Generate a UUID when no id is given; pass False
+                         to leave the id unset (e.g. for server-assigned ids)
+            validate: Run pydantic validation; pass False to clone a
+                      pre-built template instead (faster for bulk imports of
+                      trusted data, but inputs are stored as given)
             
         Returns:
             FHIR Procedure resource
@@ -107,7 +124,7 @@ class ProcedureBuilder:
             )
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or (new_resource_id() if generate_id else None)
         
         # Parse code
         procedure_code = parse_code_input(code)
@@ -139,40 +156,217 @@ class ProcedureBuilder:
         performers = None
         if performer_references:
             performers = [
-                ProcedurePerformer(actor=ref)
+                create_model(ProcedurePerformer, validate, actor=ref)
                 for ref in performer_references
             ]
         
         # Build notes
         note = None
         if notes:
-            note = [Annotation(text=notes)]
-        
-        # Prepare R5 compatible fields
-        from fhir.resources.codeablereference import CodeableReference
+            note = [create_model(Annotation, validate, text=notes)]
         
-        # reason is List[CodeableReference] in R5
+        # reason is List[CodeableReference] in R5. The concepts come from
+        # parse_code_input and are already valid, so the wrapper is never
+        # re-validated
         reason_val = None
         if reason_code:
-            reason_val = [CodeableReference(concept=rc) for rc in reason_code]
+            reason_val = [create_model(CodeableReference, False, concept=rc) for rc in reason_code]
 
         # Create the Procedure resource
-        procedure = Procedure(
-            id=resource_id,
+        procedure_kwargs = {
+            "id": resource_id,
+            "code": procedure_code,
+            "encounter": encounter_reference,
+            "occurrenceDateTime": performed_datetime,
+            "occurrencePeriod": performed_period,
+            "performer": performers,
+            "location": location_reference,
+            "reason": reason_val,
+            "bodySite": body_site_list,
+            "outcome": outcome_concept,
+            "note": note,
+        }
+        
+        # status and subject are required elements, so they are always
+        # passed (even as None); optional elements only when set
+        procedure_kwargs = {k: v for k, v in procedure_kwargs.items() if v is not None}
+        procedure = create_model(
+            Procedure,
+            validate,
             status=status,
-            code=procedure_code,
             subject=subject_reference,
-            encounter=encounter_reference,
-            occurrenceDateTime=performed_datetime,
-            occurrencePeriod=performed_period,
-            performer=performers,
-            location=location_reference,
-            reason=reason_val,
-            bodySite=body_site_list,
-            outcome=outcome_concept,
-            note=note,
+            **procedure_kwargs
         )
         
         return procedure
+    
+    @staticmethod
+    def build_dict(
+        code: CodeInput,
+        status: str = ProcedureStatus.COMPLETED,
+        performed_date: Optional[DateTimeInput] = None,
+        performed_start: Optional[DateTimeInput] = None,
+        performed_end: Optional[DateTimeInput] = None,
+        body_site: Optional[CodeInput] = None,
+        outcome: Optional[CodeInput] = None,
+        notes: Optional[str] = None,
+        reason: Optional[CodeInput] = None,
+        subject_reference: Optional[Union[Reference, Dict[str, Any]]] = None,
+        encounter_reference: Optional[Union[Reference, Dict[str, Any]]] = None,
+        performer_references: Optional[List[Union[Reference, Dict[str, Any]]]] = None,
+        location_reference: Optional[Union[Reference, Dict[str, Any]]] = None,
+        id: Optional[str] = None,
+        generate_id: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Build a Procedure directly in its FHIR JSON form.
+        
+        Takes the same arguments as build() and returns what
+        build(...).model_dump(mode="json") would, without creating any
+        pydantic models. Nothing is validated, so this is meant for bulk
+        pipelines that serialize trusted data straight away. References
+        may also be given as dicts already in JSON form. Date strings are
+        copied as given, while the model re-renders them (e.g. "+00:00"
+        as "Z"), so pass canonical FHIR strings or datetime objects.
+        
+        Returns:
+            Procedure resource as a JSON-ready dict
+            
+        Example:
+            payload = ProcedureBuilder.build_dict(
+                code="Appendectomy",
+                performed_date="2023-06-15"
+            )
+        """
+        resource_id = id or (new_resource_id() if generate_id else None)
+        
+        procedure = {"resourceType": "Procedure"}
+        if resource_id:
+            procedure["id"] = resource_id
+        procedure["status"] = code_value(status)
+        procedure["code"] = parse_code_input_dict(code)
+        if subject_reference is not None:
+            procedure["subject"] = reference_dict(subject_reference)
+        if encounter_reference is not None:
+            procedure["encounter"] = reference_dict(encounter_reference)
+        
+        if performed_date:
+            procedure["occurrenceDateTime"] = format_datetime(performed_date)
+        elif performed_start or performed_end:
+            period = {}
+            if performed_start:
+                period["start"] = format_datetime(performed_start)
+            if performed_end:
+                period["end"] = format_datetime(performed_end)
+            procedure["occurrencePeriod"] = period
+        
+        if performer_references:
+            procedure["performer"] = [
+                {"actor": reference_dict(ref)} for ref in performer_references
+            ]
+        if location_reference is not None:
+            procedure["location"] = reference_dict(location_reference)
+        if reason:
+            procedure["reason"] = [{"concept": parse_code_input_dict(reason)}]
+        if body_site:
+            procedure["bodySite"] = [parse_code_input_dict(body_site)]
+        if outcome:
+            procedure["outcome"] = parse_code_input_dict(outcome)
+        if notes:
+            procedure["note"] = [{"text": notes}]
+        
+        return procedure
+    
+    @staticmethod
+    def build_batch(
+        records: List[Dict[str, Any]],
+        performed_date: Optional[DateTimeInput] = None,
+        subject_reference: Optional[Reference] = None,
+        encounter_reference: Optional[Reference] = None,
+        performer_references: Optional[List[Reference]] = None,
+        location_reference: Optional[Reference] = None,
+        validate: bool = True,
+    ) -> List[Procedure]:
+        """
+        Build several Procedure resources that share common details,
+        e.g. the procedure history recorded at one visit.
+        
+        The shared references are passed through unchanged, so every
+        resource reuses the same objects (treat them as read-only).
+        Repeated code strings already share one CodeableConcept through
+        parse_code_input.
+        
+        Args:
+            records: One dict of build() keyword arguments per procedure;
+                     keys given here override the shared values below
+            performed_date: When the procedures were performed (not applied
+                            to records that set performed_start/performed_end)
+            subject_reference: Reference to patient
+            encounter_reference: Reference to encounter
+            performer_references: References to performers
+            location_reference: Reference to location
+            validate: Run pydantic validation (see build())
+            
+        Returns:
+            List of FHIR Procedure resources, in record order
+            
+        Example:
+            procedures = ProcedureBuilder.build_batch(
+                [
+                    {"code": "Appendectomy", "performed_date": "2015-02-01"},
+                    {"code": "Tonsillectomy", "notes": "Childhood"},
+                ],
+                subject_reference=patient_ref
+            )
+        """
+        common = {
+            "performed_date": performed_date,
+            "subject_reference": subject_reference,
+            "encounter_reference": encounter_reference,
+            "performer_references": performer_references,
+            "location_reference": location_reference,
+            "validate": validate,
+        }
+        return [
+            ProcedureBuilder.build(**merge_batch_record(common, record, _PERFORMED_ALTERNATIVES))
+            for record in records
+        ]
+    
+    @staticmethod
+    def build_batch_dict(
+        records: List[Dict[str, Any]],
+        performed_date: Optional[DateTimeInput] = None,
+        subject_reference: Optional[Reference] = None,
+        encounter_reference: Optional[Reference] = None,
+        performer_references: Optional[List[Reference]] = None,
+        location_reference: Optional[Reference] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build several Procedures directly in their FHIR JSON form.
+        
+        Takes the same arguments as build_batch() (without validate) and
+        returns the build_dict() form of each result. The shared references
+        are serialized once and the same dicts are placed in every result
+        (treat them as read-only).
+        
+        Returns:
+            List of Procedure resources as JSON-ready dicts, in record order
+        """
+        common = {
+            "performed_date": performed_date,
+            "subject_reference": shared_reference_dict(subject_reference),
+            "encounter_reference": shared_reference_dict(encounter_reference),
+            "performer_references": [
+                shared_reference_dict(ref) for ref in performer_references
+            ] if performer_references else None,
+            "location_reference": shared_reference_dict(location_reference),
+        }
+        return [
+            ProcedureBuilder.build_dict(**merge_batch_record(common, record, _PERFORMED_ALTERNATIVES))
+            for record in records
+        ]
+
 
+# A record's own period replaces the shared performed_date in build_batch()
+_PERFORMED_ALTERNATIVES = {"performed_date": ("performed_start", "performed_end")}
 
@@ -11,7 +11,6 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/servicerequest.html
 """
 
-import uuid
 from typing import Optional, List, Union
 from datetime import datetime
 
@@ -29,6 +28,7 @@ from ..types import (
     parse_code_input,
     format_datetime,
     create_period,
+    new_resource_id,
 )
 
 
@@ -119,7 +119,7 @@ class ServiceRequestBuilder:
         Internal method to build a ServiceRequest.
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or new_resource_id()
         
         # Parse code
         service_code = parse_code_input(code)
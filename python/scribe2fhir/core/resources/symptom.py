@@ -12,7 +12,6 @@ FHIR Mapping:
 Reference: https://www.hl7.org/fhir/observation.html
 """
 
-import uuid
 from typing import Optional, List, Union
 from datetime import datetime, date
 
@@ -23,7 +22,7 @@ from fhir.resources.period import Period
 from fhir.resources.reference import Reference
 from fhir.resources.annotation import Annotation
 
-from ..enums import ObservationStatus, Severity, Laterality, FindingStatus
+from ..enums import ObservationStatus, Severity, Laterality, FindingStatus, code_value, coerce_code
 from ..types import (
     CodeInput,
     DateTimeInput,
@@ -33,6 +32,7 @@ from ..types import (
     create_codeable_concept,
     create_coding,
     create_period,
+    new_resource_id,
 )
 
 
@@ -97,7 +97,7 @@ class SymptomBuilder:
             FHIR Observation resource
         """
         # Generate ID if not provided
-        resource_id = id or str(uuid.uuid4())
+        resource_id = id or new_resource_id()
         
         # Parse the symptom code
         symptom_code = parse_code_input(code)
@@ -117,7 +117,7 @@ class SymptomBuilder:
         ]
         
         # Handle status enum
-        obs_status = status.value if isinstance(status, ObservationStatus) else status
+        obs_status = code_value(status)
         
         # Build effective period or dateTime
         effective = None
@@ -134,7 +134,7 @@ class SymptomBuilder:
         
         # Add severity component
         if severity:
-            sev = severity if isinstance(severity, Severity) else Severity(severity.lower())
+            sev = coerce_code(Severity, severity)
             components.append(
                 ObservationComponent(
                     code=CodeableConcept(
@@ -161,7 +161,7 @@ class SymptomBuilder:
         
         # Add laterality component
         if laterality:
-            lat = laterality if isinstance(laterality, Laterality) else Laterality(laterality.lower())
+            lat = coerce_code(Laterality, laterality)
             components.append(
                 ObservationComponent(
                     code=CodeableConcept(
@@ -188,7 +188,7 @@ class SymptomBuilder:
         
         # Add finding status component (present/absent)
         if finding_status:
-            fs = finding_status if isinstance(finding_status, FindingStatus) else FindingStatus(finding_status.lower())
+            fs = coerce_code(FindingStatus, finding_status)
             components.append(
                 ObservationComponent(
                     code=CodeableConcept(
@@ -5,7 +5,10 @@ This module provides utility functions for creating common FHIR data types
 like CodeableConcept, Coding, Quantity, etc.
 """
 
-from typing import Optional, List, Tuple, Union
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional, List, Tuple, Type, TypeVar, Union
 from datetime import datetime, date
 
 from fhir.resources.codeableconcept import CodeableConcept
@@ -32,6 +35,8 @@ QuantityInput = Union[
 
 DateTimeInput = Union[str, datetime, date, None]
 
+ModelT = TypeVar("ModelT")
+
 
 # =============================================================================
 # CODING SYSTEM URLS
@@ -80,6 +85,96 @@ def create_coding(
     )
 
 
+class _IdPool:
+    """Random (version 4) UUID strings cut from buffered os.urandom() blocks."""
+    
+    BLOCK_SIZE = 4096  # 256 ids per os.urandom() call
+    
+    def __init__(self) -> None:
+        self._reset()
+    
+    def _reset(self) -> None:
+        # Also run in forked children so they never reuse the parent's bytes
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._offset = 0
+    
+    def next_id(self) -> str:
+        with self._lock:
+            offset = self._offset
+            if offset >= len(self._buffer):
+                self._buffer = os.urandom(self.BLOCK_SIZE)
+                offset = 0
+            self._offset = offset + 16
+            hex_ = self._buffer[offset:offset + 16].hex()
+        # Set the version (4) and RFC 4122 variant (10xx) bits
+        return (
+            f"{hex_[:8]}-{hex_[8:12]}-4{hex_[13:16]}-"
+            f"{'89ab'[int(hex_[16], 16) & 3]}{hex_[17:20]}-{hex_[20:]}"
+        )
+
+
+_ID_POOL = _IdPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_ID_POOL._reset)
+
+
+def new_resource_id() -> str:
+    """
+    Generate a random resource ID in UUID4 form.
+    
+    Equivalent to str(uuid.uuid4()), but the random bytes are read in
+    blocks, so bulk builds make one os.urandom() call per 256 ids.
+    
+    Returns:
+        UUID string (e.g. "3f1c2b9e-8d4a-4c6f-9b1e-2a7d5c0e4f13")
+    """
+    return _ID_POOL.next_id()
+
+
+def create_model(model_cls: Type[ModelT], validate: bool = True, **kwargs: Any) -> ModelT:
+    """
+    Instantiate a FHIR model, optionally skipping pydantic validation.
+    
+    With validate=False the elements that are set (None values are dropped)
+    are copied onto an empty, unvalidated instance of model_cls, so no
+    validators or coercions run and inputs must already be well-formed.
+    The serialized output matches the validated model for such inputs.
+    Element names are still checked, so a misspelled or non-R5 element
+    raises instead of being dropped.
+    
+    Args:
+        model_cls: The fhir.resources model class
+        validate: Run pydantic validation (default: True)
+        **kwargs: Model elements
+        
+    Returns:
+        Model instance
+        
+    Raises:
+        ValueError: If validate=False and a keyword is not a field of model_cls
+    """
+    if validate:
+        return model_cls(**kwargs)
+    fields = model_cls.model_fields
+    unknown = [name for name in kwargs if name not in fields]
+    if unknown:
+        raise ValueError(
+            f"Unknown {model_cls.__name__} element(s): {', '.join(unknown)}"
+        )
+    return _model_template(model_cls).model_copy(
+        update={k: v for k, v in kwargs.items() if v is not None}
+    )
+
+
+@lru_cache(maxsize=None)
+def _model_template(model_cls: Type[ModelT]) -> ModelT:
+    """Empty, unvalidated instance of model_cls for create_model() to clone."""
+    # model_construct() is slower than validation for large resources,
+    # so it is done once per class and copied from then on
+    return model_cls.model_construct()
+
+
 def create_codeable_concept(
     text: Optional[str] = None,
     codings: Optional[List[Coding]] = None,
@@ -121,6 +216,10 @@ def parse_code_input(code_input: CodeInput) -> CodeableConcept:
     - (display, (code, system)): Display with code tuple
     - CodeableConcept: Return as-is
     
+    String and tuple inputs are cached, so repeated codes share one
+    CodeableConcept; treat the result as read-only, or use
+    parse_code_input_fresh() if it will be modified.
+    
     Args:
         code_input: Code input in various formats
         
@@ -130,6 +229,34 @@ def parse_code_input(code_input: CodeInput) -> CodeableConcept:
     if isinstance(code_input, CodeableConcept):
         return code_input
     
+    if isinstance(code_input, (str, tuple)):
+        try:
+            return _parse_code_input_cached(code_input)
+        except TypeError:
+            # Unhashable element (e.g. a nested list); parse without caching
+            pass
+    
+    return _parse_code_input(code_input)
+
+
+def parse_code_input_fresh(code_input: CodeInput) -> CodeableConcept:
+    """
+    Like parse_code_input, but always builds a new CodeableConcept for
+    string and tuple inputs instead of returning the shared cached instance.
+    
+    Args:
+        code_input: Code input in various formats
+        
+    Returns:
+        CodeableConcept object
+    """
+    if isinstance(code_input, CodeableConcept):
+        return code_input
+    return _parse_code_input(code_input)
+
+
+def _parse_code_input(code_input: CodeInput) -> CodeableConcept:
+    """Build a new CodeableConcept from a str, tuple or list code input."""
     if isinstance(code_input, str):
         return CodeableConcept(text=code_input)
     
@@ -158,6 +285,108 @@ def parse_code_input(code_input: CodeInput) -> CodeableConcept:
     raise ValueError(f"Invalid code input format: {code_input}")
 
 
+_parse_code_input_cached = lru_cache(maxsize=4096)(_parse_code_input)
+
+
+def parse_code_input_dict(code_input: CodeInput) -> Dict[str, Any]:
+    """
+    Parse a code input into the FHIR JSON form of a CodeableConcept.
+    
+    Accepts the same formats as parse_code_input() and returns what
+    parse_code_input(code_input).model_dump(mode="json") would, but builds
+    plain dicts directly for str and tuple inputs (no validation).
+    
+    Args:
+        code_input: Code input in various formats
+        
+    Returns:
+        CodeableConcept as a JSON-ready dict
+    """
+    if isinstance(code_input, CodeableConcept):
+        return code_input.model_dump(mode="json", exclude_none=True)
+    
+    if isinstance(code_input, str):
+        return {"text": code_input}
+    
+    if isinstance(code_input, (list, tuple)):
+        if len(code_input) == 3 and all(isinstance(x, str) for x in code_input):
+            # (code, system, display)
+            code, system, display = code_input
+            return _coded_concept_dict(code, system, display)
+        elif len(code_input) == 2:
+            display, code_tuple = code_input
+            if isinstance(code_tuple, (list, tuple)) and len(code_tuple) == 2:
+                # (display, (code, system))
+                code, system = code_tuple
+                return _coded_concept_dict(code, system, display)
+    
+    raise ValueError(f"Invalid code input format: {code_input}")
+
+
+def _coded_concept_dict(code: str, system: str, display: Optional[str]) -> Dict[str, Any]:
+    """Dict form of create_codeable_concept(text=display, code=..., system=..., display=...)."""
+    coding = {"system": system or "", "code": code}
+    if display is not None:
+        coding["display"] = display
+    concept = {"coding": [coding]}
+    if display:
+        concept["text"] = display
+    return concept
+
+
+def reference_dict(reference: Union[Reference, Dict[str, Any]]) -> Dict[str, Any]:
+    """JSON form of a Reference; dicts are assumed to be in JSON form already."""
+    if isinstance(reference, dict):
+        return reference
+    return reference.model_dump(mode="json", exclude_none=True)
+
+
+def shared_reference_dict(
+    reference: Optional[Union[Reference, Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """
+    JSON form of a reference shared by a build_batch_dict() call.
+
+    Dicts are validated into a Reference first, so invalid keys raise
+    instead of being copied into every resource. None stays None.
+    """
+    if reference is None:
+        return None
+    if isinstance(reference, dict):
+        reference = Reference(**reference)
+    return reference_dict(reference)
+
+
+def merge_batch_record(
+    shared: Dict[str, Any],
+    record: Dict[str, Any],
+    alternatives: Optional[Dict[str, Tuple[str, ...]]] = None,
+) -> Dict[str, Any]:
+    """
+    Merge the shared values of a build_batch() call into one record.
+
+    Shared values that are None are left out, and keys set in the record
+    win. A shared key listed in alternatives is also left out when the
+    record sets any of its alternative keys (e.g. a shared performed_date
+    must not hide a record's own performed_start/performed_end).
+
+    Args:
+        shared: Keyword arguments common to every record
+        record: Keyword arguments for one resource
+        alternatives: Shared key -> record keys that replace it
+
+    Returns:
+        Keyword arguments for the resource's build method
+    """
+    merged = {key: value for key, value in shared.items() if value is not None}
+    if alternatives:
+        for key, replaced_by in alternatives.items():
+            if any(record.get(name) is not None for name in replaced_by):
+                merged.pop(key, None)
+    merged.update(record)
+    return merged
+
+
 def create_quantity(
     value: float,
     unit: str,
@@ -220,6 +449,11 @@ def create_period(
     """
     Create a FHIR Period object.
     
+    Periods given as strings or dates are cached, so repeated (start, end)
+    pairs share one Period; treat the result as read-only. datetime inputs
+    are not cached: equal instants in different time zones compare equal
+    but format differently.
+    
     Args:
         start: Start datetime
         end: End datetime
@@ -227,12 +461,29 @@ def create_period(
     Returns:
         Period object
     """
+    if not isinstance(start, datetime) and not isinstance(end, datetime):
+        try:
+            return _create_period_cached(start, end)
+        except TypeError:
+            # Unhashable input; build without caching
+            pass
+    return _create_period(start, end)
+
+
+def _create_period(
+    start: Optional[DateTimeInput] = None,
+    end: Optional[DateTimeInput] = None
+) -> Period:
+    """Build a new Period from start/end inputs."""
     return Period(
         start=format_datetime(start) if start else None,
         end=format_datetime(end) if end else None
     )
 
 
+_create_period_cached = lru_cache(maxsize=4096)(_create_period)
+
+
 def create_annotation(text: str, time: Optional[DateTimeInput] = None) -> Annotation:
     """
     Create a FHIR Annotation (note) object.
@@ -296,7 +547,11 @@ def format_datetime(dt: DateTimeInput) -> Optional[str]:
     if isinstance(dt, datetime):
         if dt.tzinfo is None:
             dt = dt.astimezone()
-        return dt.isoformat()
+        formatted = dt.isoformat()
+        # UTC as "Z", the form the fhir.resources models serialize to
+        if formatted.endswith("+00:00"):
+            return formatted[:-6] + "Z"
+        return formatted
     
     if isinstance(dt, date):
         return dt.isoformat()
@@ -321,8 +576,11 @@ def format_date(d: DateTimeInput) -> Optional[str]:
         # Try to parse and reformat
         return d.split("T")[0] if "T" in d else d
     
-    if isinstance(d, (datetime, date)):
-        return d.strftime("%Y-%m-%d")
+    if isinstance(d, datetime):
+        return d.date().isoformat()
+    
+    if isinstance(d, date):
+        return d.isoformat()
     
     return str(d)
 
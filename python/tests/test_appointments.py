@@ -4,7 +4,7 @@ Test cases for Appointment resources (follow-up appointments).
 
 import pytest
 from datetime import datetime, timedelta
-from scribe2fhir.core import FHIRDocumentBuilder
+from scribe2fhir.core import FHIRDocumentBuilder, AppointmentBuilder
 
 
 class TestAppointmentResource:
@@ -185,6 +185,37 @@ class TestAppointmentResource:
                          and entry["resource"]["id"] == custom_id), None)
         
         assert app_entry is not None
+    
+    def test_followup_without_generated_id(self, test_dates):
+        """Test that ID generation can be skipped for server-assigned IDs."""
+        appointment = AppointmentBuilder.build(
+            start=test_dates['future'],
+            generate_id=False
+        )
+        assert appointment.id is None
+        
+        # An explicit ID still wins
+        appointment = AppointmentBuilder.build(
+            start=test_dates['future'],
+            id="appointment-1",
+            generate_id=False
+        )
+        assert appointment.id == "appointment-1"
+    
+    def test_participant_actors_are_validated(self, test_dates):
+        """Test that participant references are validated and coerced."""
+        appointment = AppointmentBuilder.build(
+            start=test_dates['future'],
+            patient_reference={"reference": "Patient/1"}
+        )
+        assert appointment.participant[0].actor.reference == "Patient/1"
+        assert appointment.participant[0].status == "accepted"
+        
+        with pytest.raises(ValueError):
+            AppointmentBuilder.build(
+                start=test_dates['future'],
+                patient_reference={"reference": "Patient/1", "bogus": 1}
+            )
 
 
 class TestAppointmentBundleIntegration:
@@ -4,7 +4,7 @@ Test cases for CarePlan and Communication resources (advice and clinical notes).
 
 import pytest
 from datetime import datetime, timedelta
-from scribe2fhir.core import FHIRDocumentBuilder
+from scribe2fhir.core import FHIRDocumentBuilder, AdviceBuilder, ClinicalNoteBuilder
 
 
 class TestAdviceResource:
@@ -136,6 +136,15 @@ class TestAdviceResource:
         assert care_plan is not None
         assert care_plan.subject is not None  # Should have patient reference
         assert care_plan.encounter is None    # No encounter reference
+    
+    def test_advice_without_validation_matches_validated(self):
+        """Test that the unvalidated advice path serializes identically."""
+        kwargs = dict(advice_text="Drink plenty of water", category="lifestyle", id="advice-1")
+        validated = AdviceBuilder.build(**kwargs)
+        unvalidated = AdviceBuilder.build(validate=False, **kwargs)
+        
+        assert unvalidated.model_dump(mode="json", exclude_none=True) == \
+            validated.model_dump(mode="json", exclude_none=True)
 
 
 class TestClinicalNotesResource:
@@ -3,14 +3,18 @@ Test cases for Medical History resources (family history, allergies, immunizatio
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from scribe2fhir.core import (
     FHIRDocumentBuilder,
+    AllergyBuilder,
     AllergyCategory,
     AllergyClinicalStatus,
     AllergyCriticality,
     ImmunizationStatus,
-    ProcedureStatus
+    ImmunizationBuilder,
+    ProcedureBuilder,
+    ProcedureStatus,
+    parse_code_input_fresh,
 )
 
 
@@ -178,6 +182,45 @@ class TestAllergyHistory:
         assert allergy.patient is not None
         assert "Patient/" in allergy.patient.reference
     
+    def test_allergy_without_generated_id(self):
+        """Test that ID generation can be skipped for server-assigned IDs."""
+        allergy = AllergyBuilder.build(code="Peanuts", generate_id=False)
+        assert allergy.id is None
+        
+        allergy = AllergyBuilder.build(code="Peanuts")
+        assert allergy.id is not None
+    
+    def test_allergy_codes_render_as_strings(self):
+        """Test that code enum members still format as their code strings."""
+        assert str(AllergyCategory.FOOD) == "food"
+        assert f"{AllergyCategory.FOOD}" == "food"
+        assert "{}".format(AllergyCriticality.UNABLE_TO_ASSESS) == "unable-to-assess"
+    
+    def test_allergy_without_validation_matches_validated(self):
+        """Test that the unvalidated template path serializes identically."""
+        kwargs = dict(
+            code="Peanuts",
+            category=AllergyCategory.FOOD,
+            criticality=AllergyCriticality.HIGH,
+            onset="2020-01-01",
+            notes="Carries epinephrine",
+            id="allergy-1",
+        )
+        validated = AllergyBuilder.build(**kwargs)
+        unvalidated = AllergyBuilder.build(validate=False, **kwargs)
+        
+        assert unvalidated.model_dump(mode="json", exclude_none=True) == \
+            validated.model_dump(mode="json", exclude_none=True)
+    
+    def test_repeated_allergen_shares_code_concept(self):
+        """Test that repeated plain-string allergens reuse one CodeableConcept."""
+        first = AllergyBuilder.build(code="Paracetamol")
+        second = AllergyBuilder.build(code="Paracetamol")
+        
+        assert first.code is second.code
+        assert parse_code_input_fresh("Paracetamol") is not first.code
+        assert parse_code_input_fresh("Paracetamol").text == "Paracetamol"
+    
     def test_allergy_with_all_properties(self, encounter_builder):
         """Test comprehensive allergy."""
         allergy = encounter_builder.add_allergy_history(
@@ -339,6 +382,66 @@ class TestImmunizationHistory:
             
             assert immunization.status == expected_status
     
+    def test_immunization_batch_shares_common_details(self):
+        """Test building a visit's immunizations in one batch."""
+        immunizations = ImmunizationBuilder.build_batch(
+            [
+                {"vaccine": "MMR vaccine", "lot_number": "M123"},
+                {"vaccine": "Varicella vaccine", "route": "Oral"},
+            ],
+            occurrence_date="2024-03-01",
+            route="Subcutaneous",
+            site="Left arm",
+        )
+        
+        assert [imm.vaccineCode.text for imm in immunizations] == ["MMR vaccine", "Varicella vaccine"]
+        assert immunizations[0].lotNumber == "M123"
+        assert immunizations[0].route.text == "Subcutaneous"
+        assert immunizations[1].route.text == "Oral"  # Record overrides shared value
+        assert immunizations[0].site is immunizations[1].site
+        assert all(imm.occurrenceDateTime is not None for imm in immunizations)
+    
+    def test_immunization_batch_keeps_record_occurrence_string(self):
+        """Test that a shared occurrence_date does not hide a record's occurrence_string."""
+        immunizations = ImmunizationBuilder.build_batch(
+            [
+                {"vaccine": "BCG", "occurrence_string": "at birth"},
+                {"vaccine": "MMR vaccine"},
+            ],
+            occurrence_date="2024-03-01",
+        )
+    
+        assert immunizations[0].occurrenceDateTime is None
+        assert immunizations[0].occurrenceString == "at birth"
+        assert immunizations[1].occurrenceDateTime.isoformat() == "2024-03-01"
+    
+    def test_immunization_dict_matches_model_dump(self):
+        """Test that build_dict produces the same JSON as build()."""
+        kwargs = dict(
+            vaccine=("207", "http://hl7.org/fhir/sid/cvx", "COVID-19 mRNA vaccine"),
+            occurrence_date="2021-04-15",
+            lot_number="L123",
+            route="Intramuscular",
+            dose_quantity=0.5,
+            reason="Travel",
+            notes="Second dose",
+            id="imm-1",
+        )
+        expected = ImmunizationBuilder.build(**kwargs).model_dump(mode="json", exclude_none=True)
+        
+        assert ImmunizationBuilder.build_dict(**kwargs) == expected
+        
+        # UTC datetimes render as "Z" on both paths
+        kwargs["occurrence_date"] = datetime(2021, 4, 15, 10, 0, tzinfo=timezone.utc)
+        expected = ImmunizationBuilder.build(**kwargs).model_dump(mode="json", exclude_none=True)
+        assert ImmunizationBuilder.build_dict(**kwargs) == expected
+    
+    def test_unvalidated_build_rejects_unknown_elements(self):
+        """Test that validate=False raises on elements the model does not have."""
+        # doseNumberPositiveInt is R4-only; it must not be silently dropped
+        with pytest.raises(ValueError):
+            ImmunizationBuilder.build("MMR vaccine", dose_number=1, validate=False)
+    
     def test_immunization_series_tracking(self, encounter_builder):
         """Test immunization series tracking."""
         # First dose
@@ -436,6 +539,143 @@ class TestProcedureHistory:
             )
             
             assert procedure.status == expected_status
+    
+    def test_procedure_generate_id_disabled(self):
+        """Test that ID generation can be skipped for server-assigned IDs."""
+        procedure = ProcedureBuilder.build(code="Vasectomy", generate_id=False)
+        assert procedure.id is None
+        
+        procedure = ProcedureBuilder.build(code="Vasectomy")
+        assert procedure.id is not None
+    
+    def test_procedure_batch_shares_details(self):
+        """Test building several procedures with shared references."""
+        patient_ref = ProcedureBuilder.build(
+            code="x", subject_reference={"reference": "Patient/p1"}
+        ).subject
+        procedures = ProcedureBuilder.build_batch(
+            [
+                {"code": "Appendectomy", "performed_date": "2015-02-01"},
+                {"code": "Tonsillectomy", "status": ProcedureStatus.UNKNOWN},
+            ],
+            performed_date="2020-01-01",
+            subject_reference=patient_ref,
+        )
+        
+        assert [p.code.text for p in procedures] == ["Appendectomy", "Tonsillectomy"]
+        assert procedures[0].occurrenceDateTime.isoformat() == "2015-02-01"  # Record overrides shared value
+        assert procedures[1].occurrenceDateTime.isoformat() == "2020-01-01"
+        assert procedures[1].status == "unknown"
+        assert procedures[0].subject is procedures[1].subject
+    
+    def test_procedure_dict_matches_model_dump(self):
+        """Test that build_dict produces the same JSON as build()."""
+        performer = ProcedureBuilder.build(
+            code="x", subject_reference={"reference": "Practitioner/dr1"}
+        ).subject
+        kwargs = dict(
+            code=("80146002", "http://snomed.info/sct", "Appendectomy"),
+            performed_start="2023-06-15T10:00:00+05:30",
+            performed_end="2023-06-15T11:30:00+05:30",
+            body_site="Abdomen",
+            outcome="Successful removal",
+            reason="Acute appendicitis",
+            notes="Laparoscopic approach",
+            performer_references=[performer],
+            id="procedure-1",
+        )
+        expected = ProcedureBuilder.build(**kwargs).model_dump(mode="json", exclude_none=True)
+        
+        assert ProcedureBuilder.build_dict(**kwargs) == expected
+        
+        # UTC datetimes render as "Z" on both paths
+        kwargs["performed_end"] = datetime(2023, 6, 15, 6, 0, tzinfo=timezone.utc)
+        expected = ProcedureBuilder.build(**kwargs).model_dump(mode="json", exclude_none=True)
+        assert ProcedureBuilder.build_dict(**kwargs) == expected
+        
+        # Enum statuses are stored as their plain code strings
+        payload = ProcedureBuilder.build_dict(code="x", status=ProcedureStatus.COMPLETED)
+        assert type(payload["status"]) is str
+    
+    def test_procedure_batch_dict_serializes_references_once(self):
+        """Test that build_batch_dict matches build_dict and shares references."""
+        patient_ref = ProcedureBuilder.build(
+            code="x", subject_reference={"reference": "Patient/p1"}
+        ).subject
+        records = [
+            {"code": "Appendectomy", "id": "p1"},
+            {"code": "Tonsillectomy", "notes": "Childhood", "id": "p2"},
+        ]
+        procedures = ProcedureBuilder.build_batch_dict(
+            records, performed_date="2020-01-01", subject_reference=patient_ref
+        )
+        
+        assert procedures == [
+            ProcedureBuilder.build_dict(
+                performed_date="2020-01-01", subject_reference=patient_ref, **record
+            )
+            for record in records
+        ]
+        assert procedures[0]["subject"] is procedures[1]["subject"]
+        
+        # Shared dict references are validated before being copied everywhere
+        with pytest.raises(ValueError):
+            ProcedureBuilder.build_batch_dict(
+                records, subject_reference={"reference": "Patient/1", "bogus": 1}
+            )
+
+    def test_procedure_batch_keeps_record_period(self):
+        """Test that a shared performed_date does not hide a record's own period."""
+        records = [
+            {"code": "Dialysis", "performed_start": "2020-01-01", "performed_end": "2020-01-02"},
+            {"code": "Appendectomy"},
+        ]
+        procedures = ProcedureBuilder.build_batch(records, performed_date="2024-05-05")
+    
+        assert procedures[0].occurrenceDateTime is None
+        assert procedures[0].occurrencePeriod.start.isoformat() == "2020-01-01"
+        assert procedures[1].occurrenceDateTime.isoformat() == "2024-05-05"
+    
+        payloads = ProcedureBuilder.build_batch_dict(records, performed_date="2024-05-05")
+        assert "occurrenceDateTime" not in payloads[0]
+        assert payloads[0]["occurrencePeriod"] == {"start": "2020-01-01", "end": "2020-01-02"}
+        assert payloads[1]["occurrenceDateTime"] == "2024-05-05"
+    
+    def test_repeated_performed_period_is_shared(self):
+        """Test that repeated string periods reuse one Period."""
+        first = ProcedureBuilder.build(
+            code="Dialysis", performed_start="2024-01-01", performed_end="2024-01-05"
+        )
+        second = ProcedureBuilder.build(
+            code="Dialysis", performed_start="2024-01-01", performed_end="2024-01-05"
+        )
+        assert first.occurrencePeriod is second.occurrencePeriod
+        
+        start = datetime(2024, 1, 1, 9, 0)
+        first = ProcedureBuilder.build(code="Dialysis", performed_start=start)
+        second = ProcedureBuilder.build(code="Dialysis", performed_start=start)
+        assert first.occurrencePeriod is not second.occurrencePeriod
+    
+    def test_procedure_without_validation_matches_validated(self):
+        """Test that the unvalidated template path serializes identically."""
+        kwargs = dict(
+            code="Appendectomy",
+            performed_date=datetime(2023, 6, 15, 9, 30, tzinfo=timezone.utc),
+            body_site="Abdomen",
+            outcome="Successful removal",
+            reason="Acute appendicitis",
+            notes="Laparoscopic approach",
+            subject_reference={"reference": "Patient/p1"},
+            id="procedure-1",
+        )
+        validated = ProcedureBuilder.build(**kwargs)
+        unvalidated = ProcedureBuilder.build(
+            validate=False,
+            **{**kwargs, "subject_reference": validated.subject}
+        )
+        
+        assert unvalidated.model_dump(mode="json", exclude_none=True) == \
+            validated.model_dump(mode="json", exclude_none=True)
 
 
 class TestMedicalHistoryBundleIntegration:
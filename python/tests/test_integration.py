@@ -6,7 +6,11 @@ and ensures all components work together correctly.
 """
 
 import pytest
+import io
 import json
+import os
+import subprocess
+import sys
 from datetime import datetime, timedelta
 from scribe2fhir.core import (
     FHIRDocumentBuilder,
@@ -352,6 +356,37 @@ class TestCompleteWorkflow:
         parsed_builder_json = json.loads(builder_json)
         assert parsed_builder_json["resourceType"] == "Bundle"
     
+    def test_stream_bundle_matches_convert_to_fhir(self):
+        """Test that streamed bundles and NDJSON match convert_to_fhir()."""
+        empty = FHIRDocumentBuilder()
+        stream = io.StringIO()
+        empty.stream_bundle(stream)
+        streamed = json.loads(stream.getvalue())
+        expected = empty.convert_to_fhir()
+        streamed.pop("timestamp")
+        expected.pop("timestamp")
+        assert streamed == expected
+        
+        builder = FHIRDocumentBuilder()
+        builder.add_patient(name="Test Patient", age=(25, "years"))
+        builder.add_encounter()
+        builder.add_symptom(code="Test Symptom")
+        builder.add_medical_condition_history(code="Hypertension")
+        
+        stream = io.StringIO()
+        builder.stream_bundle(stream, bundle_type="document")
+        streamed = json.loads(stream.getvalue())
+        expected = builder.convert_to_fhir(bundle_type="document")
+        streamed.pop("timestamp")
+        expected.pop("timestamp")
+        assert streamed == expected
+        
+        lines = list(builder.iter_ndjson())
+        assert all(line.endswith("\n") for line in lines)
+        assert [json.loads(line) for line in lines] == [
+            entry["resource"] for entry in expected["entry"]
+        ]
+        
     def test_empty_bundle(self):
         """Test creating a bundle with no resources."""
         builder = FHIRDocumentBuilder()
@@ -413,6 +448,51 @@ class TestCompleteWorkflow:
             if "encounter" in resource:
                 assert resource["encounter"]["reference"] in resource_ids
     
+    def test_resources_share_patient_and_encounter_references(self):
+        """Test that resources for one patient/encounter share Reference objects."""
+        builder = FHIRDocumentBuilder()
+        builder.add_patient(name="Reference Test", age=(30, "years"))
+        builder.add_encounter()
+        symptom = builder.add_symptom(code="Test Symptom")
+        procedure = builder.add_procedure_history(code="Test Procedure")
+        
+        assert symptom.subject is procedure.subject
+        assert symptom.encounter is procedure.encounter
+        
+        # A new patient gets a new reference
+        builder.add_patient(name="Another Patient", age=(40, "years"))
+        other = builder.add_symptom(code="Test Symptom")
+        assert other.subject is not symptom.subject
+        assert other.subject.display == "Another Patient"
+    
+    def test_unvalidated_builder_matches_validated(self):
+        """Test that validate=False builds the same bundle entries."""
+        def build(validate):
+            builder = FHIRDocumentBuilder(bundle_id="bundle-1", validate=validate)
+            builder.add_patient(name="John Doe", age=(30, "years"), gender="male", id="p1")
+            builder.add_encounter(id="e1")
+            builder.add_vital_finding(code="Heart Rate", value=72, unit="bpm", id="o1")
+            builder.add_lab_finding(code="Hemoglobin", value=12.5, unit="g/dL", interpretation="low", id="o2")
+            builder.add_procedure_history(code="Appendectomy", date="2015-01-01", id="pr1")
+            builder.add_immunisation_history(vaccine="Flu vaccine", occurrence_date="2023-10-01", id="i1")
+            builder.add_advice(note="Rest", id="c1")
+            builder.add_notes(note="Follow-up in a week", id="n1")
+            return builder
+        
+        unvalidated = build(validate=False)
+        unvalidated.validate()
+        
+        assert unvalidated.convert_to_fhir()["entry"] == build(validate=True).convert_to_fhir()["entry"]
+    
+    def test_validate_reports_invalid_resources(self):
+        """Test that validate() rejects resources built without validation."""
+        builder = FHIRDocumentBuilder(validate=False)
+        builder.add_patient(name="John Doe", age=(30, "years"))
+        builder.add_procedure_history(code="Appendectomy", date="not a date")
+        
+        with pytest.raises(ValueError):
+            builder.validate()
+    
     def test_large_bundle_performance(self):
         """Test performance with a large number of resources."""
         builder = FHIRDocumentBuilder()
@@ -453,3 +533,19 @@ class TestCompleteWorkflow:
         assert fhir_time < 5.0
         
         print(f"Build time: {build_time:.2f}s, FHIR conversion time: {fhir_time:.2f}s")
+    
+    def test_package_import_is_lazy(self):
+        """Test that importing the package defers loading the builders."""
+        code = (
+            "import sys, scribe2fhir; "
+            "assert 'scribe2fhir.core.document_builder' not in sys.modules; "
+            "assert 'fhir.resources.bundle' not in sys.modules; "
+            "from scribe2fhir import ProcedureBuilder; "
+            "assert 'scribe2fhir.core.resources.procedure' in sys.modules; "
+            "assert 'scribe2fhir.core.document_builder' not in sys.modules"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
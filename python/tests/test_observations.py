@@ -3,11 +3,12 @@ Test cases for Vital Signs, Lab Findings, and Examination Observations.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from scribe2fhir.core import (
     FHIRDocumentBuilder,
     Interpretation,
-    ObservationStatus
+    ObservationStatus,
+    ObservationBuilder
 )
 
 
@@ -195,6 +196,91 @@ class TestLabFindingObservations:
         
         assert observation.effectiveDateTime.replace(tzinfo=None, microsecond=0) == test_dates['yesterday'].replace(microsecond=0)
         assert observation.note[0].text == "Fasting sample collected"
+    
+    def test_lab_findings_bulk(self):
+        """Test building lab findings from column lists."""
+        observations = ObservationBuilder.build_labs_bulk(
+            codes=["Hemoglobin", "Urine Color"],
+            values=[12, "Yellow"],
+            units=["g/dL", None],
+            interpretations=[Interpretation.NORMAL, None]
+        )
+        
+        assert len(observations) == 2
+        assert all(o.category[0].coding[0].code == "laboratory" for o in observations)
+        assert observations[0].valueQuantity.value == 12
+        assert observations[0].interpretation[0].text == "Normal"
+        assert observations[1].valueString == "Yellow"
+        assert observations[1].interpretation is None
+        
+        with pytest.raises(ValueError):
+            ObservationBuilder.build_labs_bulk(codes=["Hemoglobin"], values=[12, 13])
+    
+    def test_lab_dict_matches_model_dump(self):
+        """Test that build_lab_dict produces the same JSON as build_lab()."""
+        kwargs = dict(
+            code=("Hemoglobin", ("718-7", "http://loinc.org")),
+            value=12.5,
+            unit="g/dL",
+            date="2024-01-15T09:30:00+05:30",
+            interpretation=Interpretation.LOW,
+            notes="Fasting sample",
+            id="obs-1",
+        )
+        expected = ObservationBuilder.build_lab(**kwargs).model_dump(mode="json", exclude_none=True)
+        
+        assert ObservationBuilder.build_lab_dict(**kwargs) == expected
+        
+        # UTC datetimes render as "Z" on both paths
+        kwargs["date"] = datetime(2024, 1, 15, 4, 0, tzinfo=timezone.utc)
+        expected = ObservationBuilder.build_lab(**kwargs).model_dump(mode="json", exclude_none=True)
+        assert ObservationBuilder.build_lab_dict(**kwargs) == expected
+    
+    def test_lab_batch_shares_references(self):
+        """Test that build_batch reuses one validated subject reference."""
+        observations = ObservationBuilder.build_batch(
+            [
+                {"code": "Hemoglobin", "value": 12.5, "unit": "g/dL"},
+                {"code": "WBC", "value": 7.2, "unit": "10^3/uL", "interpretation": Interpretation.HIGH},
+            ],
+            date="2024-03-01",
+            subject_reference={"reference": "Patient/123"}
+        )
+        
+        assert len(observations) == 2
+        assert observations[0].subject is observations[1].subject
+        assert observations[0].subject.reference == "Patient/123"
+        assert observations[1].interpretation[0].text == "High"
+        
+        payloads = ObservationBuilder.build_batch_dict(
+            [{"code": "Hemoglobin", "value": 12.5, "unit": "g/dL"}],
+            subject_reference={"reference": "Patient/123"}
+        )
+        assert payloads[0]["subject"] == {"reference": "Patient/123"}
+        
+        # A record's own date wins over the shared one, in both batch APIs
+        records = [{"code": "Hemoglobin", "date": "2024-02-01"}, {"code": "WBC"}]
+        shared_date = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        observations = ObservationBuilder.build_batch(records, date=shared_date)
+        payloads = ObservationBuilder.build_batch_dict(records, date=shared_date)
+        assert [p["effectiveDateTime"] for p in payloads] == ["2024-02-01", "2024-03-01T00:00:00Z"]
+        assert observations[0].effectiveDateTime.isoformat() == "2024-02-01"
+    
+    def test_lab_findings_batch_matches_single_adds(self, encounter_builder):
+        """Test that add_lab_findings_batch builds what add_lab_finding would."""
+        records = [
+            {"code": "Hemoglobin", "value": 12.5, "unit": "g/dL", "id": "lab-1"},
+            {"code": "WBC", "value": 7.2, "unit": "10^3/uL", "interpretation": "high", "id": "lab-2"},
+        ]
+        observations = encounter_builder.add_lab_findings_batch(records)
+        
+        assert encounter_builder.observations[-2:] == observations
+        for observation, record in zip(observations, records):
+            expected = encounter_builder.add_lab_finding(**record)
+            assert observation.model_dump(mode="json") == expected.model_dump(mode="json")
+        
+        vitals = encounter_builder.add_vital_findings_batch([{"code": "Heart Rate", "value": 72, "unit": "bpm"}])
+        assert vitals[0].category[0].coding[0].code == "vital-signs"
 
 
 class TestExaminationObservations:
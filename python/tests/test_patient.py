@@ -115,6 +115,15 @@ class TestPatientResource:
         assert patient.name[0].given == ["John", "Michael"]
         assert patient.name[0].family == "Smith"
     
+    def test_same_string_name_is_not_shared(self):
+        """Test that patients with the same name string get separate HumanNames."""
+        first = FHIRDocumentBuilder().add_patient(name="Jane Doe")
+        second = FHIRDocumentBuilder().add_patient(name="Jane Doe")
+        
+        assert first.name[0] is not second.name[0]
+        first.name[0].family = "Roe"
+        assert second.name[0].family == "Doe"
+    
     def test_patient_identifier_variations(self, builder):
         """Test different identifier formats."""
         # Test with system URLs